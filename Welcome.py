@@ -1,7 +1,11 @@
 import streamlit as st
 import os
-import base64
-from pathlib import Path
+
+from debate_engine.assets import sidebar_image
+from debate_engine.warmup import start_prewarm
+
+# Load the debate engine in the background while the visitor reads this page and enters their key
+start_prewarm()
 
 
 st.set_page_config(
@@ -15,18 +19,9 @@ if "api_keys_initialized" not in st.session_state:
     st.session_state.api_keys_initialized = True
     st.session_state.openai_api_key = ""
 
-assets_dir = Path(__file__).parent / "assets"
-gif_path = assets_dir / "animate-logo.gif"
-
 try:
-    # Read and display the GIF
-    with open(gif_path, "rb") as file_:
-        contents = file_.read()
-        data_url = base64.b64encode(contents).decode("utf-8")
-        st.sidebar.markdown(
-            f'<img src="data:image/gif;base64,{data_url}" alt="V3 AI animated logo">',
-            unsafe_allow_html=True,
-        )
+    # Served from static/ so the browser caches it instead of receiving it again on every rerun
+    sidebar_image("animate-logo.gif", "V3 AI animated logo")
 except Exception as e:
     st.error(f"Could not load animated logo: {str(e)}")
 
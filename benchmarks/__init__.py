@@ -0,0 +1 @@
+"""Offline microbenchmarks for the debate engine. Run with ``python -m benchmarks.<name>``."""
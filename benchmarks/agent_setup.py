@@ -0,0 +1,38 @@
+"""Per-turn agent setup cost: create_react_agent on every turn vs. the shared graph registry."""
+import argparse
+import time
+
+from langgraph.prebuilt import create_react_agent
+
+from benchmarks.fakes import fake_llm, google_search
+from debate_engine.registry import get_react_agent, registry
+
+PROMPT = "You are the Champion in a debate."
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=60)
+    args = parser.parse_args()
+
+    llm = fake_llm()
+    tools = [google_search]
+
+    start = time.perf_counter()
+    for _ in range(args.turns):
+        create_react_agent(llm, tools=tools, prompt=PROMPT)
+    rebuild = (time.perf_counter() - start) / args.turns
+
+    registry.clear()
+    start = time.perf_counter()
+    for _ in range(args.turns):
+        get_react_agent("Champion", llm, PROMPT, tools)
+    cached = (time.perf_counter() - start) / args.turns
+
+    print(f"rebuild per turn:  {rebuild * 1000:8.3f} ms")
+    print(f"registry per turn: {cached * 1000:8.3f} ms  ({registry.stats()})")
+    print(f"speedup:           {rebuild / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
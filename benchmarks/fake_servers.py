@@ -0,0 +1,198 @@
+"""Local stand-ins for the OpenAI chat completions and Google Custom Search APIs, for offline benchmarks.
+
+Point a client at them with ``ChatOpenAI(base_url=chat.url, api_key="fake")`` and
+``GoogleSearchBackend(key, cse, api_endpoint=search.url)`` (or ``SEARCH_API_ENDPOINT``).
+"""
+import json
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _FakeServer:
+    def __init__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+
+    def _handler_class(self):
+        raise NotImplementedError
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeChatServer(_FakeServer):
+    """Streams a canned reply at ``tokens_per_second`` after ``first_token_latency`` seconds.
+
+    With ``tool_calls`` set, a request that offers tools and has no tool result yet
+    is answered with ``searches_per_step`` ``google_search`` calls first, as the
+    debate agents' ReAct loop expects. With ``requests_per_minute`` set it behaves like a rate-limited
+    provider: the limit is enforced over a sliding one-second window, and excess
+    requests get 429 with a ``retry-after`` header. The first ``server_errors`` requests
+    get a 502, like a flaky gateway in front of the provider.
+    """
+
+    def __init__(self, reply="A canned argument citing https://example.com/evidence.", first_token_latency=0.2,
+                 tokens_per_second=50.0, requests_per_minute=None, tool_calls=False, searches_per_step=1,
+                 server_errors=0):
+        self.reply = reply
+        self.first_token_latency = first_token_latency
+        self.tokens_per_second = tokens_per_second
+        self.requests_per_minute = requests_per_minute
+        self.tool_calls = tool_calls
+        self.searches_per_step = searches_per_step
+        self.server_errors = server_errors
+        self.requests = 0
+        self.rate_limited = 0
+        self._recent = deque()
+        self._lock = threading.Lock()
+        super().__init__()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def _wants_search(self, request) -> bool:
+        messages = request.get("messages", [])
+        return self.tool_calls and bool(request.get("tools")) and not any(m.get("role") == "tool" for m in messages)
+
+    def _admit(self):
+        """Return seconds until the next slot if this request is over the limit, else None."""
+        with self._lock:
+            self.requests += 1
+            if not self.requests_per_minute:
+                return None
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] > 1:
+                self._recent.popleft()
+            if len(self._recent) >= max(1, self.requests_per_minute / 60):
+                self.rate_limited += 1
+                return 1 - (now - self._recent[0])
+            self._recent.append(now)
+            return None
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(_Handler):
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with fake._lock:
+                    failing = fake.server_errors > 0
+                    fake.server_errors -= failing
+                if failing:
+                    self._send_json(502, {"error": {"message": "Bad gateway", "type": "server_error"}})
+                    return
+                retry_after = fake._admit()
+                if retry_after is not None:
+                    self._send_json(
+                        429,
+                        {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                        {"retry-after": f"{retry_after:.2f}"},
+                    )
+                    return
+                time.sleep(fake.first_token_latency)
+                model = request.get("model", "fake")
+                if not request.get("stream"):
+                    tokens = fake.reply.split(" ")
+                    time.sleep(len(tokens) / fake.tokens_per_second)
+                    self._send_json(200, {
+                        "id": "chatcmpl-fake", "object": "chat.completion", "created": int(time.time()), "model": model,
+                        "choices": [{"index": 0, "message": {"role": "assistant", "content": fake.reply}, "finish_reason": "stop"}],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": len(tokens), "total_tokens": len(tokens)},
+                    })
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+
+                def send(delta, finish_reason=None):
+                    chunk = {
+                        "id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+
+                if fake._wants_search(request):
+                    # A fresh query each time, so the search cache does not answer it
+                    question = request["messages"][-1].get("content") or "debate evidence"
+                    calls = []
+                    for index in range(fake.searches_per_step):
+                        call_id = uuid.uuid4().hex[:8]
+                        arguments = json.dumps({"search_term": " ".join(str(question).split()[:6] + [call_id])})
+                        calls.append({"index": index, "id": f"call_{call_id}", "type": "function",
+                                      "function": {"name": "google_search", "arguments": arguments}})
+                    send({"role": "assistant", "content": None, "tool_calls": calls})
+                    send({}, "tool_calls")
+                else:
+                    for token in fake.reply.split(" "):
+                        send({"role": "assistant", "content": token + " "})
+                        time.sleep(1 / fake.tokens_per_second)
+                    send({}, "stop")
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+        return Handler
+
+
+class FakeSearchServer(_FakeServer):
+    """Answers Custom Search ``cse.list`` requests with canned results after ``latency`` seconds."""
+
+    def __init__(self, latency=0.3):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        super().__init__()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(_Handler):
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests += 1
+                query = parse_qs(urlparse(self.path).query)
+                term = query.get("q", [""])[0]
+                num = int(query.get("num", ["3"])[0])
+                time.sleep(fake.latency)
+                items = [
+                    {"title": f"{term} ({i + 1})", "snippet": f"Canned finding {i + 1} about {term}.",
+                     "link": f"https://example.com/{i + 1}"}
+                    for i in range(num)
+                ]
+                self._send_json(200, {"kind": "customsearch#search", "items": items})
+
+        return Handler
@@ -0,0 +1,41 @@
+import itertools
+import json
+import re
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.tools import tool
+
+
+class FakeToolChatModel(GenericFakeChatModel):
+    """Streams canned replies word by word and supports tool calls, so it can drive a ReAct agent."""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        message = next(self.messages)
+        if message.tool_calls:
+            tool_call_chunks = [
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+                for i, call in enumerate(message.tool_calls)
+            ]
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=tool_call_chunks))
+            return
+        for token in re.split(r"(\s)", message.content):
+            if token:
+                chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+                if run_manager:
+                    run_manager.on_llm_new_token(token, chunk=chunk)
+                yield chunk
+
+
+def fake_llm(reply: str = "A short canned argument with a source https://example.com") -> FakeToolChatModel:
+    return FakeToolChatModel(messages=itertools.repeat(AIMessage(content=reply)))
+
+
+@tool
+def google_search(search_term: str, num_results: int = 3) -> list:
+    """Search Google for the given query."""
+    return [{"title": search_term, "snippet": "Canned snippet.", "link": "https://example.com"}]
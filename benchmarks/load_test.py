@@ -0,0 +1,153 @@
+"""Offline load test: N concurrent debates through the real graph nodes against fake chat and search servers.
+
+    python -m benchmarks.load_test --debates 16 --ttft 0.5 --tokens-per-second 40 --search-latency 0.3
+
+Reports throughput, turn latency percentiles, event-loop lag and memory per session.
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import time
+import uuid
+
+# The fake servers have no limits; keep the scheduler and the response cache out of the measurement
+os.environ.setdefault("LLM_RPM", "1000000")
+os.environ.setdefault("LLM_TPM", "1000000000")
+os.environ.pop("LLM_CACHE", None)
+os.environ.pop("LLM_CACHE_PATH", None)
+
+from langgraph.checkpoint.memory import MemorySaver  # noqa: E402
+
+from benchmarks.fake_servers import FakeChatServer, FakeSearchServer  # noqa: E402
+from debate_engine.graph import MAX_TURNS, run_debate  # noqa: E402
+from debate_engine.metrics import DebateMetrics  # noqa: E402
+from debate_engine.profiling import rss_bytes  # noqa: E402
+from debate_engine.prompts import DEBATE_TOPICS  # noqa: E402
+from debate_engine.scheduler import ScheduledChatOpenAI  # noqa: E402
+from debate_engine.search_client import GoogleSearchBackend, set_search_backend  # noqa: E402
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def make_reply(words: int) -> str:
+    body = " ".join(itertools.islice(itertools.cycle("evidence from https://example.com/study shows a clear effect".split()), words))
+    return f"🏆 Winner: Champion\n\n🎭 Debate Summary: {body}\n\n💡 Final Thoughts: Done."
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a sleeping task, and samples RSS while it runs."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.lags = []
+        self.peak_rss = rss_bytes()
+        self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, time.perf_counter() - start - self.interval))
+            self.peak_rss = max(self.peak_rss, rss_bytes())
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+
+
+async def run_load(args, chat: FakeChatServer):
+    llm = ScheduledChatOpenAI(base_url=chat.url, api_key="fake", model="fake-gpt-4", temperature=0.3, streaming=True)
+    checkpointer = MemorySaver()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    all_metrics = []
+    turns_saved = []
+
+    async def one(topic):
+        metrics = DebateMetrics(str(uuid.uuid4()))
+        all_metrics.append(metrics)
+        config = {
+            "configurable": {
+                "llm": llm,
+                "thread_id": metrics.debate_id,
+                "__google_api_key": "fake",
+                "__google_cse_id": "fake",
+                "parallel_openings": args.parallel_openings,
+                "adaptive_length": args.adaptive,
+                "metrics": metrics,
+            }
+        }
+        async with semaphore:
+            try:
+                state = await run_debate(topic, config, checkpointer)
+                turns_saved.append(MAX_TURNS - len(state["transcript"]))
+                return bool(state.get("result"))
+            except Exception as e:
+                logging.error(f"Debate {metrics.debate_id} failed: {str(e)}")
+                return False
+
+    topics = list(itertools.islice(itertools.cycle(DEBATE_TOPICS), args.debates))
+    baseline_rss = rss_bytes()
+    start = time.perf_counter()
+    with LoopLagMonitor() as monitor:
+        results = await asyncio.gather(*(one(topic) for topic in topics))
+    wall = time.perf_counter() - start
+    return results, wall, all_metrics, monitor, baseline_rss, turns_saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--debates", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=8, help="Debates running at the same time")
+    parser.add_argument("--ttft", type=float, default=0.3, help="Fake model seconds to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50)
+    parser.add_argument("--reply-words", type=int, default=120)
+    parser.add_argument("--search-latency", type=float, default=0.3)
+    parser.add_argument("--searches-per-step", type=int, default=1, help="Tool calls the fake model makes at once")
+    parser.add_argument("--parallel-openings", action="store_true")
+    parser.add_argument("--adaptive", action="store_true", help="Call the jury early once arguments converge")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    chat = FakeChatServer(reply=make_reply(args.reply_words), first_token_latency=args.ttft,
+                          tokens_per_second=args.tokens_per_second, tool_calls=True,
+                          searches_per_step=args.searches_per_step)
+    search = FakeSearchServer(latency=args.search_latency)
+    with chat, search:
+        set_search_backend(GoogleSearchBackend("fake", "fake", api_endpoint=search.url))
+        try:
+            results, wall, all_metrics, monitor, baseline_rss, turns_saved = asyncio.run(run_load(args, chat))
+        finally:
+            set_search_backend(None)
+
+    spans = [span for metrics in all_metrics for span in metrics.spans]
+    turns = [span.duration for span in spans if span.kind == "turn"]
+    ttfts = [span.attrs["ttft"] for span in spans if span.kind == "turn" and span.attrs.get("ttft") is not None]
+    searches = [span.duration for span in spans if span.kind == "search"]
+    finished = sum(results)
+
+    print(f"debates     {finished}/{len(results)} finished in {wall:.2f}s ({finished / wall * 60:.1f}/min, {len(turns) / wall:.2f} turns/s)")
+    print(f"turn        p50 {percentile(turns, 50):.2f}s  p95 {percentile(turns, 95):.2f}s  p99 {percentile(turns, 99):.2f}s")
+    print(f"ttft        p50 {percentile(ttfts, 50):.2f}s  p95 {percentile(ttfts, 95):.2f}s")
+    print(f"search      p50 {percentile(searches, 50) * 1000:.0f}ms  p95 {percentile(searches, 95) * 1000:.0f}ms  "
+          f"({len(searches)} tool calls, {search.requests} reached the server)")
+    print(f"loop lag    p50 {percentile(monitor.lags, 50) * 1000:.1f}ms  p99 {percentile(monitor.lags, 99) * 1000:.1f}ms  "
+          f"max {max(monitor.lags, default=0) * 1000:.1f}ms")
+    print(f"memory      {(monitor.peak_rss - baseline_rss) / max(1, args.concurrency) / 2**20:.1f} MB RSS per concurrent session "
+          f"(peak {monitor.peak_rss / 2**20:.0f} MB)")
+    print(f"chat server {chat.requests} requests")
+    if args.adaptive:
+        print(f"adaptive    {sum(turns_saved)} of {len(turns_saved) * MAX_TURNS} turns saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Debate wall time with sequential vs. concurrent opening statements, using a fake model with a fixed token rate."""
+import argparse
+import asyncio
+import itertools
+import time
+import uuid
+
+from langchain_core.messages import AIMessage
+
+from benchmarks.fakes import FakeToolChatModel
+from debate_engine.checkpoints import get_memory_checkpointer
+from debate_engine.graph import run_debate
+
+REPLY = " ".join(["An argument backed by https://example.com/evidence."] * 10) + "\n\n🏆 Winner: Champion"
+
+
+class PacedChatModel(FakeToolChatModel):
+    """Streams its reply at ``tokens_per_second``, like a real model would."""
+
+    tokens_per_second: float = 100.0
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        for chunk in super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            time.sleep(1 / self.tokens_per_second)
+            yield chunk
+
+
+async def run_once(parallel: bool, tokens_per_second: float) -> float:
+    llm = PacedChatModel(messages=itertools.repeat(AIMessage(content=REPLY)), tokens_per_second=tokens_per_second)
+    config = {"configurable": {"llm": llm, "thread_id": str(uuid.uuid4()), "parallel_openings": parallel}}
+    start = time.perf_counter()
+    state = await run_debate("Is remote work better than office work?", config, get_memory_checkpointer())
+    assert len(state["transcript"]) == 6 and state["result"]
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--tokens-per-second", type=float, default=200)
+    args = parser.parse_args()
+
+    for label, parallel in (("sequential", False), ("parallel", True)):
+        times = [asyncio.run(run_once(parallel, args.tokens_per_second)) for _ in range(args.runs)]
+        print(f"{label:<10} {sum(times) / len(times):6.2f}s per debate (best {min(times):.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
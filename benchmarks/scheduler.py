@@ -0,0 +1,46 @@
+"""Concurrent model calls against a rate-limited fake endpoint: plain client retries vs. the shared scheduler."""
+import argparse
+import asyncio
+import time
+
+from langchain_openai import ChatOpenAI
+
+from benchmarks.fake_servers import FakeChatServer
+from debate_engine.scheduler import LLMScheduler, ScheduledChatOpenAI
+
+
+async def run_calls(llm, calls: int) -> int:
+    results = await asyncio.gather(*(llm.ainvoke("Argue your case.") for _ in range(calls)), return_exceptions=True)
+    return sum(isinstance(result, Exception) for result in results)
+
+
+def measure(label, llm, server, calls):
+    start = time.perf_counter()
+    failed = asyncio.run(run_calls(llm, calls))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed:6.2f}s  failed {failed:3d}/{calls}  429s from server {server.rate_limited}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=40)
+    parser.add_argument("--rpm", type=int, default=600)
+    args = parser.parse_args()
+
+    with FakeChatServer(first_token_latency=0.05, tokens_per_second=200, requests_per_minute=args.rpm) as server:
+        plain = ChatOpenAI(base_url=server.url, api_key="fake", model="fake", streaming=True, max_retries=2)
+        measure("plain", plain, server, args.calls)
+
+    with FakeChatServer(first_token_latency=0.05, tokens_per_second=200, requests_per_minute=args.rpm) as server:
+        # Budget slightly under the server's limit, with a small burst, as LLM_RPM would be configured
+        scheduler = LLMScheduler(requests_per_minute=args.rpm * 0.9, tokens_per_minute=10_000_000)
+        scheduler.requests.available = 5
+        scheduled = ScheduledChatOpenAI(
+            base_url=server.url, api_key="fake", model="fake", streaming=True, scheduler=scheduler
+        )
+        measure("scheduled", scheduled, server, args.calls)
+        print(f"scheduler: {scheduler.stats()}")
+
+
+if __name__ == "__main__":
+    main()
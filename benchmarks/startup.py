@@ -0,0 +1,116 @@
+"""Cold-start cost of the debate page: import time of what it loads up front, and latency of the first debate.
+
+    python -m benchmarks.startup --max-import-seconds 1.0
+
+Every measurement runs in a fresh interpreter. The first debate is timed from
+"Start Debate" to its first token and to the verdict, against the fake chat and
+search servers, once cold and once after ``prewarm()``. Exits non-zero when the
+page's own imports take longer than ``--max-import-seconds``.
+"""
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.fake_servers import FakeChatServer, FakeSearchServer
+
+PAGE = Path(__file__).resolve().parent.parent / "pages" / "3_Try_out_a_debate!.py"
+
+
+def page_imports():
+    """The modules the debate page imports at the top level, i.e. on every first script run."""
+    modules = []
+    for node in ast.parse(PAGE.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules.append(node.module)
+    return modules
+
+
+IMPORT_CHILD = """
+import importlib, json, sys, time
+import streamlit  # already loaded by the server before any page runs
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+heavy = [m for m in ("langchain_openai", "langgraph", "googleapiclient", "altair", "tiktoken") if m in sys.modules]
+print(json.dumps({"seconds": time.perf_counter() - start, "heavy": heavy}))
+"""
+
+DEBATE_CHILD = """
+import asyncio, json, os, sys, time
+chat_url, search_url, prewarm = sys.argv[1], sys.argv[2], sys.argv[3] == "1"
+os.environ["SEARCH_API_ENDPOINT"] = search_url
+os.environ["DEBATE_PREWARM"] = "0"
+import streamlit
+from debate_engine.view import DebateView, TurnWriter
+from debate_engine.warmup import prewarm as run_prewarm
+if prewarm:
+    run_prewarm()
+
+first_token = []
+
+class Writer(TurnWriter):
+    def write(self, text):
+        if not first_token and text.strip():
+            first_token.append(time.perf_counter())
+        super().write(text)
+
+class View(DebateView):
+    def start_turn(self, name, round_num):
+        return Writer()
+
+async def main():
+    # What the page does after the button press: lazy imports, the client, then the run
+    start = time.perf_counter()
+    from debate_engine.checkpoints import get_memory_checkpointer
+    from debate_engine.graph import run_debate
+    from debate_engine.scheduler import ScheduledChatOpenAI
+    llm = ScheduledChatOpenAI(base_url=chat_url, api_key="fake", model="fake-gpt-4", temperature=0.3, streaming=True)
+    config = {"configurable": {"llm": llm, "thread_id": "startup", "view": View(),
+                               "__google_api_key": "fake", "__google_cse_id": "fake"}}
+    await run_debate("Is remote work better than office work?", config, get_memory_checkpointer())
+    end = time.perf_counter()
+    print(json.dumps({"first_token": first_token[0] - start, "debate": end - start}))
+
+asyncio.run(main())
+"""
+
+
+def child(code, *args):
+    output = subprocess.run([sys.executable, "-c", code, *args], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-import-seconds", type=float, default=None)
+    parser.add_argument("--ttft", type=float, default=0.05, help="Fake model seconds to first token")
+    args = parser.parse_args()
+
+    modules = page_imports()
+    imports = [child(IMPORT_CHILD, *[m for m in modules if m != "streamlit"]) for _ in range(args.runs)]
+    import_seconds = statistics.median(run["seconds"] for run in imports)
+    print(f"page imports  {import_seconds:.3f}s median over {args.runs} fresh interpreters"
+          f" (heavy modules loaded: {', '.join(imports[0]['heavy']) or 'none'})")
+
+    reply = "An argument backed by https://example.com/evidence.\n\n🏆 Winner: Champion\n\n🎭 Debate Summary: Close."
+    with FakeChatServer(reply=reply, first_token_latency=args.ttft, tokens_per_second=1000) as chat, \
+            FakeSearchServer(latency=0.01) as search:
+        for label, prewarm in (("cold", "0"), ("prewarmed", "1")):
+            runs = [child(DEBATE_CHILD, chat.url, search.url, prewarm) for _ in range(args.runs)]
+            print(f"first debate  {label:<10} first token {statistics.median(r['first_token'] for r in runs):.3f}s"
+                  f"  verdict {statistics.median(r['debate'] for r in runs):.3f}s")
+
+    if args.max_import_seconds is not None and import_seconds > args.max_import_seconds:
+        print(f"FAIL: page imports took {import_seconds:.3f}s, budget is {args.max_import_seconds:.3f}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
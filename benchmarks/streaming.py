@@ -0,0 +1,72 @@
+"""Per-token streaming overhead: the old nest_asyncio run_until_complete bridge vs. the queue pipeline."""
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from debate_engine.streaming import stream_agent_tokens
+
+
+class FakeTokenGraph:
+    """Emits ``tokens`` on_chat_model_stream events, like a compiled agent would."""
+
+    def __init__(self, tokens: int):
+        self.tokens = tokens
+
+    async def astream_events(self, inputs, config=None, version="v2"):
+        chunk = SimpleNamespace(content="tok ")
+        for _ in range(self.tokens):
+            yield {"event": "on_chat_model_stream", "data": {"chunk": chunk}}
+
+
+async def run_bridge(graph) -> int:
+    # The pre-pipeline implementation: step the async generator from sync code inside a running loop
+    async def stream_response():
+        async for event in graph.astream_events({}, version="v2"):
+            if event["event"] == "on_chat_model_stream":
+                yield event["data"]["chunk"].content
+
+    def sync_stream_response(generator):
+        loop = asyncio.get_event_loop()
+        async_gen = generator()
+        while True:
+            try:
+                yield loop.run_until_complete(async_gen.__anext__())
+            except StopAsyncIteration:
+                break
+
+    return len(list(sync_stream_response(stream_response)))
+
+
+async def run_pipeline(graph) -> int:
+    count = 0
+    async for _ in stream_agent_tokens(graph, {}, None):
+        count += 1
+    return count
+
+
+def measure(label, runner, graph):
+    start = time.perf_counter()
+    count = asyncio.run(runner(graph))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<9} {count / elapsed:12,.0f} tokens/s  {elapsed / count * 1e6:8.2f} us/token")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=20000)
+    args = parser.parse_args()
+    graph = FakeTokenGraph(args.tokens)
+
+    measure("pipeline", run_pipeline, graph)
+    try:
+        import nest_asyncio
+    except ImportError:
+        print("bridge    skipped (pip install nest-asyncio to compare)")
+        return
+    nest_asyncio.apply()
+    measure("bridge", run_bridge, graph)
+
+
+if __name__ == "__main__":
+    main()
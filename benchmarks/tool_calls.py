@@ -0,0 +1,73 @@
+"""One agent turn whose model asks for several searches at once, with the debate's search limit at 1 vs. N.
+
+    python -m benchmarks.tool_calls --searches 3 --search-latency 0.5
+
+Runs the real ReAct agent against the fake chat and search servers and reports
+the turn's wall time and how long its search phase took (first search start to
+last search end).
+"""
+import argparse
+import asyncio
+import os
+import uuid
+
+# Keep the scheduler, response cache and speculative searches out of the measurement
+os.environ.setdefault("LLM_RPM", "1000000")
+os.environ.setdefault("LLM_TPM", "1000000000")
+os.environ.pop("LLM_CACHE", None)
+os.environ.pop("LLM_CACHE_PATH", None)
+os.environ["EVIDENCE_PREFETCH"] = "0"
+
+from benchmarks.fake_servers import FakeChatServer, FakeSearchServer  # noqa: E402
+from debate_engine.graph import initial_state, speak  # noqa: E402
+from debate_engine.metrics import DebateMetrics  # noqa: E402
+from debate_engine.scheduler import ScheduledChatOpenAI  # noqa: E402
+from debate_engine.search_client import GoogleSearchBackend, set_search_backend  # noqa: E402
+from debate_engine.view import TurnWriter  # noqa: E402
+
+
+async def one_turn(chat: FakeChatServer, limit: int):
+    llm = ScheduledChatOpenAI(base_url=chat.url, api_key="fake", model="fake-gpt-4", temperature=0.3, streaming=True)
+    metrics = DebateMetrics(str(uuid.uuid4()))
+    config = {
+        "configurable": {
+            "llm": llm,
+            "thread_id": metrics.debate_id,
+            "__google_api_key": "fake",
+            "__google_cse_id": "fake",
+            "metrics": metrics,
+            "search_slots": asyncio.Semaphore(limit),
+        }
+    }
+    await speak(initial_state("Is remote work better than office work?"), "Champion", TurnWriter(), config)
+    searches = [span for span in metrics.spans if span.kind == "search"]
+    turn = next(span for span in metrics.spans if span.kind == "turn")
+    window = max(s.start + s.duration for s in searches) - min(s.start for s in searches) if searches else 0.0
+    return turn.duration, window, len(searches)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--searches", type=int, default=3, help="Tool calls the fake model makes in one step")
+    parser.add_argument("--search-latency", type=float, default=0.5)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    chat = FakeChatServer(first_token_latency=0.05, tokens_per_second=500, tool_calls=True,
+                          searches_per_step=args.searches)
+    search = FakeSearchServer(latency=args.search_latency)
+    with chat, search:
+        set_search_backend(GoogleSearchBackend("fake", "fake", api_endpoint=search.url))
+        try:
+            for limit in (1, args.searches):
+                runs = [asyncio.run(one_turn(chat, limit)) for _ in range(args.runs)]
+                turn = sum(r[0] for r in runs) / len(runs)
+                window = sum(r[1] for r in runs) / len(runs)
+                print(f"limit {limit}: turn {turn:.2f}s, {runs[0][2]} searches in {window:.2f}s"
+                      f" (one search takes {args.search_latency:.2f}s)")
+        finally:
+            set_search_backend(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Shared, process-wide building blocks for the V3 Discourse Engine pages."""
@@ -0,0 +1,33 @@
+import base64
+import functools
+import mimetypes
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+
+
+@functools.lru_cache(maxsize=None)
+def _data_url(name: str) -> str:
+    # Read and encoded once per process rather than on every script rerun
+    mime = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    return f"data:{mime};base64,{base64.b64encode((STATIC_DIR / name).read_bytes()).decode('utf-8')}"
+
+
+def asset_url(name: str) -> str:
+    """URL of a file in ``static/``.
+
+    With static serving on (see ``.streamlit/config.toml``) this is a stable
+    ``app/static/`` URL the browser fetches once and caches; otherwise it falls
+    back to an inline data URL.
+    """
+    if not (STATIC_DIR / name).is_file():
+        raise FileNotFoundError(f"No static asset named {name}")
+    if st.get_option("server.enableStaticServing"):
+        return f"app/static/{name}"
+    return _data_url(name)
+
+
+def sidebar_image(name: str, alt: str) -> None:
+    st.sidebar.markdown(f'<img src="{asset_url(name)}" alt="{alt}">', unsafe_allow_html=True)
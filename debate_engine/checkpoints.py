@@ -0,0 +1,88 @@
+import functools
+import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Types the debate state stores in checkpoints, besides langchain's own
+CHECKPOINT_TYPES = [("debate_engine.transcript", "Turn")]
+
+
+def make_serializer() -> JsonPlusSerializer:
+    """The checkpoint serializer, with the debate's own types allowed back out of a saved checkpoint.
+
+    Without this, newer langgraph-checkpoint releases warn on every resumed debate
+    and will refuse to load its transcript; older ones have no allow-list at all.
+    """
+    try:
+        return JsonPlusSerializer(allowed_msgpack_modules=CHECKPOINT_TYPES)
+    except TypeError:
+        return JsonPlusSerializer()
+
+
+class BoundedMemorySaver(MemorySaver):
+    """An in-memory checkpointer that keeps the ``max_threads`` most recently used debates.
+
+    A thread's checkpoints are dropped once that many others have been read or
+    written since; the debate can then no longer be resumed or replayed.
+    """
+
+    def __init__(self, max_threads: int = 128, **kwargs):
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+    def _touch(self, config) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        with self._recent_lock:
+            self._recent[thread_id] = None
+            self._recent.move_to_end(thread_id)
+            while len(self._recent) > self.max_threads:
+                oldest, _ = self._recent.popitem(last=False)
+                self.delete_thread(oldest)
+
+    def get_tuple(self, config):
+        self._touch(config)
+        return super().get_tuple(config)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self._touch(config)
+        return super().put(config, checkpoint, metadata, new_versions)
+
+
+@functools.lru_cache(maxsize=None)
+def get_memory_checkpointer() -> BoundedMemorySaver:
+    """Shared by every session in the process, so a debate can be resumed after a rerun or reconnect.
+
+    Holds the last ``DEBATE_MEMORY_CHECKPOINTS`` debates.
+    """
+    return BoundedMemorySaver(max_threads=int(os.environ.get("DEBATE_MEMORY_CHECKPOINTS", 128)), serde=make_serializer())
+
+
+@asynccontextmanager
+async def open_checkpointer(path: Optional[str] = None) -> AsyncIterator[BaseCheckpointSaver]:
+    """Yield the checkpointer a debate run should use.
+
+    With ``path`` (or ``DEBATE_CHECKPOINT_PATH``) set, checkpoints go to that SQLite
+    file and survive a process restart; otherwise the in-memory saver is used.
+    """
+    path = path or os.environ.get("DEBATE_CHECKPOINT_PATH")
+    if not path:
+        yield get_memory_checkpointer()
+        return
+
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError as e:
+        raise RuntimeError("DEBATE_CHECKPOINT_PATH requires the langgraph-checkpoint-sqlite package") from e
+
+    # Not AsyncSqliteSaver.from_conn_string, which cannot take a serializer
+    async with aiosqlite.connect(path) as conn:
+        yield AsyncSqliteSaver(conn, serde=make_serializer())
@@ -0,0 +1,178 @@
+"""Run debates headlessly and stream transcripts and verdicts to JSONL.
+
+    python -m debate_engine.cli --all-examples --concurrency 4 --output debates.jsonl
+    python -m debate_engine.cli --topics-file topics.jsonl --retries 3
+    python -m debate_engine.cli "Is R better than Python for statistics?"
+    python -m debate_engine.cli --all-examples --llm-cache replay.db   # replay identical runs from disk
+
+Reads OPENAI_API_KEY, GOOGLE_API_KEY and GOOGLE_CSE_ID from the environment (or .env).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from dataclasses import asdict
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+from debate_engine.checkpoints import open_checkpointer
+from debate_engine.clients import get_chat_model
+from debate_engine.graph import MAX_TURNS, run_debate
+from debate_engine.jury import make_jury_panel
+from debate_engine.logs import configure_logging
+from debate_engine.metrics import DebateMetrics
+from debate_engine.prompts import DEBATE_TOPICS
+from debate_engine.view import DebateView, TurnWriter
+
+
+class JsonlSink:
+    """Appends one JSON object per line; writes happen on the event loop thread, so lines never interleave."""
+
+    def __init__(self, path: str):
+        self._file = sys.stdout if path == "-" else open(path, "a", encoding="utf-8")
+
+    def write(self, record: Dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class JsonlTurnWriter(TurnWriter):
+    def __init__(self, sink: JsonlSink, debate_id: str, name: str, round_num: int):
+        super().__init__()
+        self.sink = sink
+        self.debate_id = debate_id
+        self.name = name
+        self.round_num = round_num
+
+    def flush(self) -> None:
+        # agent_node flushes once, when the turn is finished
+        self.sink.write(
+            {"type": "turn", "debate_id": self.debate_id, "role": self.name, "round": self.round_num, "text": self.text}
+        )
+
+
+class JsonlDebateView(DebateView):
+    """Streams each finished turn of one debate to the sink; replayed turns were already written."""
+
+    def __init__(self, sink: JsonlSink, debate_id: str):
+        self.sink = sink
+        self.debate_id = debate_id
+
+    def start_turn(self, name, round_num):
+        return JsonlTurnWriter(self.sink, self.debate_id, name, round_num)
+
+
+def load_topics(args) -> List[str]:
+    topics = list(args.topics)
+    if args.all_examples:
+        topics += DEBATE_TOPICS
+    if args.topics_file:
+        with open(args.topics_file, encoding="utf-8") as f:
+            for line in filter(None, (line.strip() for line in f)):
+                record = json.loads(line)
+                topics.append(record["topic"] if isinstance(record, dict) else record)
+    return topics
+
+
+async def debate_with_retries(topic: str, base_config: Dict, checkpointer, sink: JsonlSink, retries: int) -> bool:
+    debate_id = str(uuid.uuid4())
+    metrics = DebateMetrics(debate_id)
+    config = {
+        "configurable": {
+            **base_config, "thread_id": debate_id, "view": JsonlDebateView(sink, debate_id), "metrics": metrics
+        }
+    }
+    start = time.perf_counter()
+    for attempt in range(1, retries + 2):
+        try:
+            # Same thread id on every attempt, so a retry resumes after the last finished turn
+            state = await run_debate(topic, config, checkpointer)
+        except Exception as e:
+            logging.error(f"Debate {debate_id} attempt {attempt} failed: {str(e)}")
+            if attempt > retries:
+                sink.write({"type": "debate", "debate_id": debate_id, "topic": topic, "status": "failed", "error": str(e), "attempts": attempt})
+                return False
+            await asyncio.sleep(min(2 ** attempt, 30))
+            continue
+        sink.write(
+            {
+                "type": "debate",
+                "debate_id": debate_id,
+                "topic": topic,
+                "status": "finished",
+                "attempts": attempt,
+                "elapsed": round(time.perf_counter() - start, 2),
+                "transcript": [asdict(turn) for turn in state["transcript"]],
+                "verdict": state["result"],
+                "stop_reason": state.get("stop_reason"),
+                "turns_saved": MAX_TURNS - len(state["transcript"]),
+                "timings": metrics.summary(),
+            }
+        )
+        return True
+
+
+async def run_batch(args) -> int:
+    topics = load_topics(args)
+    if not topics:
+        logging.error("No topics given; pass topics, --all-examples or --topics-file")
+        return 2
+
+    api_key = os.environ["OPENAI_API_KEY"]
+    base_config = {
+        "llm": get_chat_model(api_key, model=args.model),
+        "jury_panel": make_jury_panel(os.environ.get("JURY_PANEL", ""), api_key),
+        "__google_api_key": os.environ.get("GOOGLE_API_KEY"),
+        "__google_cse_id": os.environ.get("GOOGLE_CSE_ID"),
+        "parallel_openings": args.parallel_openings,
+        "adaptive_length": args.adaptive,
+    }
+    semaphore = asyncio.Semaphore(args.concurrency)
+    sink = JsonlSink(args.output)
+
+    async def bounded(topic):
+        async with semaphore:
+            return await debate_with_retries(topic, base_config, checkpointer, sink, args.retries)
+
+    try:
+        async with open_checkpointer() as checkpointer:
+            results = await asyncio.gather(*(bounded(topic) for topic in topics))
+    finally:
+        sink.close()
+
+    logging.info(f"Finished {sum(results)} of {len(topics)} debates")
+    return 0 if all(results) else 1
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Run debates headlessly and write transcripts and verdicts to JSONL.")
+    parser.add_argument("topics", nargs="*", help="Debate topics to run")
+    parser.add_argument("--all-examples", action="store_true", help="Run every topic in DEBATE_TOPICS")
+    parser.add_argument("--topics-file", help='JSONL file of topics, one string or {"topic": ...} per line')
+    parser.add_argument("--output", default="debates.jsonl", help="JSONL output path, or - for stdout")
+    parser.add_argument("--concurrency", type=int, default=4, help="Debates running at the same time")
+    parser.add_argument("--retries", type=int, default=2, help="Retries per failed debate")
+    parser.add_argument("--model", default="gpt-4")
+    parser.add_argument("--parallel-openings", action="store_true", help="Generate both opening statements at once")
+    parser.add_argument("--adaptive", action="store_true", help="Call the jury early once the arguments converge")
+    parser.add_argument("--llm-cache", help="SQLite file of recorded model responses to replay (sets LLM_CACHE_PATH)")
+    args = parser.parse_args()
+    if args.llm_cache:
+        os.environ["LLM_CACHE_PATH"] = args.llm_cache
+
+    configure_logging()
+    sys.exit(asyncio.run(run_batch(args)))
+
+
+if __name__ == "__main__":
+    main()
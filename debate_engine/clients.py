@@ -0,0 +1,168 @@
+import asyncio
+import atexit
+import functools
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import httpx
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class PerLoopTransport(httpx.AsyncBaseTransport):
+    """An httpx async transport that keeps one connection pool per event loop.
+
+    Async connections belong to the loop that opened them, so each loop that
+    calls the API (the job manager's, a CLI's ``asyncio.run``) gets its own pool,
+    which every pooled client on that loop shares. ``aclose`` does nothing because
+    the pools belong to the ``ClientPool``, not to any one client; ``close`` shuts them.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._factory = factory
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _transport(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                transport = self._transports[loop] = self._factory()
+            return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Close every loop's pool, on that loop if it is still running and here otherwise."""
+        with self._lock:
+            transports = list(self._transports.items())
+            self._transports.clear()
+        for loop, transport in transports:
+            if loop.is_closed():
+                continue  # nothing can await on it any more; its sockets are closed when collected
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(transport.aclose(), loop)
+            else:
+                loop.run_until_complete(transport.aclose())
+
+    def loops(self) -> int:
+        with self._lock:
+            return len(self._transports)
+
+
+class ClientPool:
+    """Process-wide, LRU-bounded pool of chat model clients.
+
+    A client is keyed by a hash of its API key plus the model and every other
+    parameter, so repeat debates from the same user (and every rerun of their
+    session) reuse one client instead of building a new one each time. All pooled
+    clients send their requests over shared keep-alive connections (HTTP/2 when
+    the ``h2`` package is installed), so a returning user skips the TLS and
+    connection setup and idle sessions hold no sockets of their own. Evicting a
+    client therefore never cuts off a debate that is still using it; the shared
+    connections expire after ``keepalive_seconds`` idle and are closed with the pool.
+    """
+
+    def __init__(self, max_clients: int = 64, http2: Optional[bool] = None, max_connections: int = 100,
+                 keepalive_seconds: float = 60):
+        self.max_clients = max_clients
+        self.http2 = http2_available() if http2 is None else http2
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clients: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_seconds,
+        )
+        timeout = httpx.Timeout(600, connect=10)
+        self._http_client = httpx.Client(http2=self.http2, limits=limits, timeout=timeout)
+        self._per_loop = PerLoopTransport(lambda: httpx.AsyncHTTPTransport(http2=self.http2, limits=limits))
+        self._http_async_client = httpx.AsyncClient(transport=self._per_loop, timeout=timeout)
+        atexit.register(self.close)
+
+    @staticmethod
+    def key(api_key: str, params: Dict[str, Any]) -> Tuple:
+        # Hashed here rather than with registry.fingerprint, which would load langgraph with the page
+        return (hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16], tuple(sorted(params.items())))
+
+    def get(self, api_key: str, **params):
+        """The pooled ``ScheduledChatOpenAI`` for this key and parameters, built on first use."""
+        from debate_engine.scheduler import ScheduledChatOpenAI
+
+        key = self.key(api_key, params)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+            self.misses += 1
+            client = ScheduledChatOpenAI(
+                api_key=api_key, http_client=self._http_client, http_async_client=self._http_async_client, **params
+            )
+            self._clients[key] = client
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+            return client
+
+    def close(self) -> None:
+        """Drop every client and close the shared connections."""
+        with self._lock:
+            self._clients.clear()
+        self._http_client.close()
+        self._per_loop.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "clients": len(self._clients),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "http2": self.http2,
+                "event_loops": self._per_loop.loops(),
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def get_client_pool() -> ClientPool:
+    """The process-wide client pool, sized by ``LLM_CLIENT_POOL_SIZE``; ``LLM_HTTP2=0`` forces HTTP/1.1."""
+    http2 = os.environ.get("LLM_HTTP2")
+    pool = ClientPool(
+        max_clients=int(os.environ.get("LLM_CLIENT_POOL_SIZE", 64)),
+        http2=None if http2 is None else http2.lower() not in ("0", "false", "no"),
+        max_connections=int(os.environ.get("LLM_MAX_CONNECTIONS", 100)),
+        keepalive_seconds=float(os.environ.get("LLM_KEEPALIVE_SECONDS", 60)),
+    )
+    if not pool.http2 and http2 is None:
+        logging.info("h2 is not installed; model clients share HTTP/1.1 keep-alive connections")
+    return pool
+
+
+def get_chat_model(api_key: str, model: str = "gpt-4", temperature: float = 0.3, streaming: bool = True):
+    """The debate chat model for this API key, from the process-wide client pool."""
+    return get_client_pool().get(api_key, model=model, temperature=temperature, streaming=streaming)
@@ -0,0 +1,71 @@
+import functools
+import os
+import re
+from typing import List, Optional
+
+from debate_engine.prefetch import keywords
+from debate_engine.transcript import Turn
+
+# Conceding the whole debate only; agreeing with a point ("I agree with the Champion that ...",
+# "my opponent is right that ..., but") is ordinary rebuttal and must not end the debate
+CONCESSION = re.compile(
+    r"\b(?:i|we) (?:must |have to )?concede (?:the|this) debate\b"
+    r"|\bmy opponent (?:has won|wins) (?:the|this) debate\b"
+    r"|\bmy opponent has won\s*(?:[.!]|$)",
+    re.IGNORECASE,
+)
+
+
+def novelty(text: str, earlier: List[str]) -> float:
+    """Share of ``text``'s content words that no earlier turn used; 1.0 for the first turn."""
+    words = set(keywords(text))
+    if not words:
+        return 0.0
+    seen = set()
+    for previous in earlier:
+        seen.update(keywords(previous))
+    return len(words - seen) / len(words)
+
+
+def adaptive_length_enabled(config) -> bool:
+    if config["configurable"].get("adaptive_length"):
+        return True
+    return os.environ.get("ADAPTIVE_LENGTH", "").lower() in ("1", "true", "yes")
+
+
+class ConvergenceScorer:
+    """Decides when a debate has stopped moving, so the jury can be called before the last round.
+
+    Scoring is lexical and costs no model call: each turn's novelty is the share
+    of its content words no earlier turn used. The debate ends early after a full
+    round once the last ``patience`` turns all fall below ``threshold`` (both
+    sides are repeating themselves), or as soon as a side concedes. Nothing is
+    decided before ``min_turns`` turns.
+    """
+
+    def __init__(self, threshold: float = 0.3, patience: int = 2, min_turns: int = 2):
+        self.threshold = threshold
+        self.patience = patience
+        self.min_turns = min_turns
+
+    def stop_reason(self, transcript: List[Turn]) -> Optional[str]:
+        """``"concession"``, ``"converged"`` or None to keep going."""
+        if len(transcript) < self.min_turns or len(transcript) % 2:
+            return None
+        if any(CONCESSION.search(turn.text) for turn in transcript[-2:]):
+            return "concession"
+        recent = transcript[-self.patience:]
+        if len(recent) == self.patience and all(
+            turn.novelty is not None and turn.novelty < self.threshold for turn in recent
+        ):
+            return "converged"
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_convergence_scorer() -> ConvergenceScorer:
+    return ConvergenceScorer(
+        threshold=float(os.environ.get("ADAPTIVE_NOVELTY_THRESHOLD", 0.3)),
+        patience=int(os.environ.get("ADAPTIVE_PATIENCE", 2)),
+        min_turns=int(os.environ.get("ADAPTIVE_MIN_TURNS", 2)),
+    )
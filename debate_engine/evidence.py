@@ -0,0 +1,174 @@
+import functools
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from debate_engine.prefetch import keywords
+from debate_engine.search_cache import SearchResults
+
+
+class EvidenceStore:
+    """Every search result the agents have seen, with a BM25 index for answering later searches locally.
+
+    Results are kept with the debate topic, the query that found them and when,
+    deduplicated by link. The index lives in memory; with ``db_path`` set the
+    evidence is also written to SQLite and reloaded (newest ``max_docs`` first)
+    on startup, so the corpus keeps growing across restarts. Once the index holds
+    ``max_docs`` results, the oldest are dropped from it to make room.
+
+    ``retrieve`` only answers when the best matches cover at least
+    ``min_coverage`` of the query's content words; anything less goes to live
+    search, whose results are then added here.
+    """
+
+    k1 = 1.5
+    b = 0.75
+
+    def __init__(self, db_path: Optional[str] = None, min_coverage: float = 0.75, max_docs: int = 50000):
+        self.db_path = db_path
+        self.min_coverage = min_coverage
+        self.max_docs = max_docs
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+        # Keyed by an id that only grows, so insertion order is age order
+        self._docs: "OrderedDict[int, Dict[str, str]]" = OrderedDict()
+        self._terms: Dict[int, Counter] = {}
+        self._lengths: Dict[int, int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._links: Dict[str, int] = {}
+        self._total_length = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+        if db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS evidence ("
+                    "link TEXT PRIMARY KEY, title TEXT NOT NULL, snippet TEXT NOT NULL, "
+                    "topic TEXT, query TEXT NOT NULL, stored_at REAL NOT NULL)"
+                )
+                rows = conn.execute(
+                    "SELECT link, title, snippet, topic, query, stored_at FROM evidence ORDER BY stored_at DESC LIMIT ?",
+                    (max_docs,),
+                ).fetchall()
+            with self._lock:
+                for link, title, snippet, topic, query, stored_at in reversed(rows):
+                    self._index({"title": title, "snippet": snippet, "link": link}, topic, query, stored_at)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _index(self, result: Dict[str, str], topic: Optional[str], query: str, stored_at: float) -> bool:
+        if result["link"] in self._links:
+            return False
+        while len(self._docs) >= self.max_docs:
+            self._evict_oldest()
+        terms = Counter(keywords(f"{result['title']} {result['snippet']}"))
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[doc_id] = {**result, "topic": topic, "query": query, "stored_at": stored_at}
+        self._terms[doc_id] = terms
+        self._lengths[doc_id] = sum(terms.values())
+        self._links[result["link"]] = doc_id
+        self._total_length += self._lengths[doc_id]
+        for term in terms:
+            self._postings.setdefault(term, set()).add(doc_id)
+        return True
+
+    def _evict_oldest(self) -> None:
+        doc_id, doc = self._docs.popitem(last=False)
+        for term in self._terms.pop(doc_id):
+            postings = self._postings[term]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(doc_id)
+        del self._links[doc["link"]]
+        self.evictions += 1
+
+    def add(self, results: SearchResults, query: str, topic: Optional[str] = None) -> int:
+        """Store the results of one search; returns how many were new."""
+        now = time.time()
+        with self._lock:
+            new = [result for result in results if self._index(result, topic, query, now)]
+        if new and self.db_path:
+            try:
+                with self._connect() as conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO evidence VALUES (?, ?, ?, ?, ?, ?)",
+                        [(r["link"], r["title"], r["snippet"], topic, query, now) for r in new],
+                    )
+            except sqlite3.Error as e:
+                logging.warning(f"Could not persist evidence: {str(e)}")
+        return len(new)
+
+    def search(self, query: str, limit: int = 3) -> List[Tuple[float, Dict[str, str]]]:
+        """The ``limit`` best (BM25 score, document) pairs for ``query``."""
+        terms = keywords(query)
+        with self._lock:
+            count = len(self._docs)
+            if not count or not terms:
+                return []
+            average_length = self._total_length / count
+            scores: Dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term, [])
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id in postings:
+                    frequency = self._terms[doc_id][term]
+                    norm = frequency + self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / norm
+            best = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+            return [(score, self._docs[doc_id]) for doc_id, score in best]
+
+    def coverage(self, query: str, docs: List[Dict[str, str]]) -> float:
+        """Share of the query's content words that appear in at least one of ``docs``."""
+        terms = set(keywords(query))
+        if not terms:
+            return 0.0
+        found = set()
+        for doc in docs:
+            found.update(keywords(f"{doc['title']} {doc['snippet']}"))
+        return len(terms & found) / len(terms)
+
+    def retrieve(self, query: str, num_results: int = 3) -> Optional[SearchResults]:
+        """Stored results good enough to stand in for a live search, or None."""
+        docs = [doc for _, doc in self.search(query, num_results)]
+        enough = len(docs) >= num_results and self.coverage(query, docs) >= self.min_coverage
+        with self._lock:
+            self.lookups += 1
+            self.hits += enough
+        if not enough:
+            return None
+        return [{"title": doc["title"], "snippet": doc["snippet"], "link": doc["link"]} for doc in docs]
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "docs": len(self._docs),
+                "terms": len(self._postings),
+                "evictions": self.evictions,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def get_evidence_store() -> Optional[EvidenceStore]:
+    """The process-wide evidence store, or None unless ``EVIDENCE_STORE`` or ``EVIDENCE_STORE_PATH`` turns it on."""
+    path = os.environ.get("EVIDENCE_STORE_PATH")
+    if not path and os.environ.get("EVIDENCE_STORE", "").lower() not in ("1", "true", "yes"):
+        return None
+    return EvidenceStore(
+        db_path=path,
+        min_coverage=float(os.environ.get("EVIDENCE_MIN_COVERAGE", 0.75)),
+        max_docs=int(os.environ.get("EVIDENCE_STORE_MAX_DOCS", 50000)),
+    )
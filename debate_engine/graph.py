@@ -0,0 +1,366 @@
+import asyncio
+import functools
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, TypedDict
+
+from langgraph.graph import END, StateGraph
+from langsmith import traceable
+
+from debate_engine.clients import get_client_pool
+from debate_engine.convergence import adaptive_length_enabled, get_convergence_scorer, novelty
+from debate_engine.evidence import get_evidence_store
+from debate_engine.jury import VerdictParser, panel_sections, run_jury_panel
+from debate_engine.logs import log_event, log_transcript
+from debate_engine.metrics import DebateMetrics, TimedWriter, metrics_registry
+from debate_engine.prefetch import EvidencePool, TurnPrefetcher, candidate_queries
+from debate_engine.profiling import MemoryProfiler, memory_profiling_enabled
+from debate_engine.prompts import challenger_prompt, champion_prompt, jury_prompt
+from debate_engine.registry import fingerprint, get_react_agent, registry
+from debate_engine.response_cache import get_response_cache
+from debate_engine.scheduler import PRIORITY_IN_PROGRESS, PRIORITY_NEW, get_scheduler, llm_priority
+from debate_engine.streaming import stream_agent_tokens
+from debate_engine.tools import get_search_cache, prefetch_search, search_concurrency, tools
+from debate_engine.transcript import ContextBuilder, Turn, count_tokens, make_turn, transcript_text
+from debate_engine.view import DebateView
+
+# Three rounds of Champion + Challenger before the jury decides
+MAX_TURNS = 6
+
+
+def _without_config(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    # The run config holds the model client, the view and the Google credentials; none of it may reach a trace
+    return {key: value for key, value in inputs.items() if key != "config"}
+
+
+# LangSmith tracing for the debate's own functions, which all take the run config
+traced = traceable(process_inputs=_without_config)
+
+
+class GraphState(TypedDict):
+    topic: str
+    transcript: List[Turn]
+    current_speaker: str
+    turn_count: int
+    result: Optional[List[Dict[str, str]]]
+    # Set when adaptive length sends the debate to the jury before MAX_TURNS
+    stop_reason: Optional[str]
+
+
+def initial_state(topic: str) -> GraphState:
+    return {
+        "topic": topic, "transcript": [], "current_speaker": "Champion", "turn_count": 0, "result": None,
+        "stop_reason": None,
+    }
+
+
+def debate_id(config) -> str:
+    return config["configurable"].get("thread_id")
+
+
+def get_view(config) -> DebateView:
+    return config["configurable"].get("view") or DebateView()
+
+
+def prefetch_budget() -> int:
+    """Speculative searches per turn for the next speaker; off (0) unless ``EVIDENCE_PREFETCH`` is set.
+
+    Each one is a paid Custom Search query whether or not the agent ends up asking for it.
+    """
+    return int(os.environ.get("EVIDENCE_PREFETCH", 0))
+
+
+def with_metrics(config):
+    """``config`` with a ``DebateMetrics`` for this run, unless the caller passed its own."""
+    configurable = config["configurable"]
+    if configurable.get("metrics"):
+        return config
+    return {**config, "configurable": {**configurable, "metrics": DebateMetrics(configurable["thread_id"])}}
+
+
+def with_evidence_pool(config):
+    """``config`` with a fresh evidence pool for this debate, if prefetching is on and search is configured."""
+    configurable = config["configurable"]
+    if "evidence_pool" in configurable or prefetch_budget() <= 0:
+        return config
+    if not configurable.get("__google_api_key") or not configurable.get("__google_cse_id"):
+        return config
+    search = functools.partial(prefetch_search, configurable["__google_api_key"], configurable["__google_cse_id"])
+    return {**config, "configurable": {**configurable, "evidence_pool": EvidencePool(search)}}
+
+
+def with_search_slots(config):
+    """``config`` with this debate's limit on searches in flight, shared by both sides and all their tool calls."""
+    configurable = config["configurable"]
+    if "search_slots" in configurable:
+        return config
+    return {**config, "configurable": {**configurable, "search_slots": asyncio.Semaphore(search_concurrency())}}
+
+
+async def speak(state, name, writer, config) -> Turn:
+    """Stream one agent turn into ``writer`` and return it as a transcript entry."""
+    # The model comes from the run config so compiled graphs can be shared between sessions
+    llm = config["configurable"]["llm"]
+    prompt = champion_prompt if name == "Champion" else challenger_prompt
+    graph = get_react_agent(name, llm, prompt, tools)
+    round_num = state["turn_count"] // 2 + 1
+
+    context, _ = ContextBuilder().build(state["transcript"])
+    message = f"Topic: {state['topic']}\n\nDebate so far:\n{context}\n\nProvide your argument for round {round_num}, {'supporting' if name == 'Champion' else 'challenging'} the topic. Use the Google search tool to find supporting evidence."
+    inputs = {"messages": [("user", message)]}
+    prompt_tokens = count_tokens(prompt) + count_tokens(message)
+    writer = TimedWriter(writer)
+
+    # While this side speaks, search ahead for what the other side will probably look up
+    pool = config["configurable"].get("evidence_pool")
+    if pool and state["turn_count"] == 0:
+        pool.prefetch(candidate_queries(state["topic"], "", name, limit=1)[0])
+    opponent = "Challenger" if name == "Champion" else "Champion"
+    prefetcher = TurnPrefetcher(pool, state["topic"], opponent, budget=prefetch_budget())
+    prefetcher.observe("")
+
+    # Debates that are already under way get model capacity before ones that are just starting
+    with llm_priority(PRIORITY_IN_PROGRESS if state["turn_count"] else PRIORITY_NEW):
+        try:
+            async for content in stream_agent_tokens(graph, inputs, config):
+                writer.write(content)
+                if "\n" in content:
+                    prefetcher.observe(writer.text)
+        except Exception as e:
+            log_event(
+                "agent_error", logging.ERROR, debate_id=debate_id(config), speaker=name, round=round_num, error=str(e)
+            )
+            writer.write(f"Error: {str(e)}. Unable to use Google Search. Providing argument without search: ")
+            fallback = await llm.ainvoke(inputs["messages"][0][1], config=config)
+            writer.write(fallback.content)
+
+    writer.flush()
+    prefetcher.finish(writer.text)
+    metrics = config["configurable"].get("metrics")
+    fields = {"prompt_tokens": prompt_tokens, **writer.stats()}
+    if metrics:
+        span = metrics.record_turn(name, round_num, writer, prompt_tokens)
+        fields.update({key: span.attrs[key] for key in ("ttft", "tokens_per_second", "completion_tokens")})
+        fields["seconds"] = span.duration
+    log_event(
+        "turn_finished", debate_id=debate_id(config), turn=state["turn_count"] + 1, speaker=name, round=round_num, **fields
+    )
+    return make_turn(
+        name, round_num, writer.text, prompt_tokens=prompt_tokens,
+        novelty=round(novelty(writer.text, [turn.text for turn in state["transcript"]]), 3),
+    )
+
+
+def check_convergence(transcript: List[Turn], config) -> Optional[str]:
+    """With adaptive length on, why the debate should go to the jury now (if it should)."""
+    if not adaptive_length_enabled(config) or len(transcript) >= MAX_TURNS:
+        return None
+    reason = get_convergence_scorer().stop_reason(transcript)
+    if reason:
+        turns_saved = MAX_TURNS - len(transcript)
+        log_event(
+            "debate_converged", debate_id=debate_id(config), reason=reason, turns=len(transcript),
+            turns_saved=turns_saved, novelty=[turn.novelty for turn in transcript],
+        )
+        metrics_registry.inc("debate_turns_saved_total", turns_saved, reason=reason)
+        get_view(config).ended_early(reason, turns_saved)
+    return reason
+
+
+@traced
+async def agent_node(state, name, config):
+    writer = get_view(config).start_turn(name, state["turn_count"] // 2 + 1)
+    turn = await speak(state, name, writer, config)
+    transcript = state["transcript"] + [turn]
+    return {
+        "transcript": transcript,
+        "current_speaker": "Challenger" if name == "Champion" else "Champion",
+        "turn_count": state["turn_count"] + 1,
+        "stop_reason": check_convergence(transcript, config),
+    }
+
+
+@traced
+async def champion_node(state, config):
+    return await agent_node(state, "Champion", config)
+
+
+@traced
+async def challenger_node(state, config):
+    return await agent_node(state, "Challenger", config)
+
+
+@traced
+async def openings_node(state, config):
+    # Neither opening statement depends on the other, so both sides speak at once
+    names = ["Champion", "Challenger"]
+    writers = get_view(config).start_openings(names)
+    turns = await asyncio.gather(*(speak(state, name, writer, config) for name, writer in zip(names, writers)))
+    transcript = state["transcript"] + list(turns)
+    return {
+        "transcript": transcript,
+        "current_speaker": "Champion",
+        "turn_count": state["turn_count"] + len(turns),
+        "stop_reason": check_convergence(transcript, config),
+    }
+
+
+@traced
+async def jury_node(state, prompt, name, config):
+    log_event("jury_started", debate_id=debate_id(config), turns=len(state["transcript"]))
+    llm = config["configurable"]["llm"]
+    full_prompt = prompt.format(history=transcript_text(state["topic"], state["transcript"]))
+    view = get_view(config)
+    view.start_jury()
+    metrics = config["configurable"].get("metrics")
+    start = time.perf_counter()
+
+    panel = config["configurable"].get("jury_panel")
+    if panel:
+        verdict = await run_jury_panel(
+            panel, full_prompt, config, max_concurrency=int(os.environ.get("JURY_PANEL_CONCURRENCY", 4))
+        )
+        sections = panel_sections(verdict)
+        for section in sections:
+            view.jury_section(section)
+        log_event("jury_finished", debate_id=debate_id(config), **verdict.stats())
+        if metrics:
+            metrics.record("jury", "Jury panel", start, time.perf_counter(), judges=len(panel), winner=verdict.winner)
+        return {"result": sections}
+
+    # Show each verdict section as soon as it is complete instead of waiting for the whole response
+    parser = VerdictParser()
+    first_byte = None
+    async for chunk in llm.astream(full_prompt, config=config):
+        if first_byte is None and chunk.content:
+            first_byte = time.perf_counter() - start
+        for section in parser.feed(chunk.content):
+            view.jury_section(section)
+    for section in parser.close():
+        view.jury_section(section)
+
+    log_event(
+        "jury_finished", debate_id=debate_id(config), sections=len(parser.sections),
+        first_byte=round(first_byte or 0, 3), seconds=round(time.perf_counter() - start, 3),
+    )
+    if metrics:
+        metrics.record("jury", "Jury", start, time.perf_counter(), ttft=round(first_byte or 0, 3))
+    return {"result": parser.sections}
+
+
+async def jury_step(state, config):
+    with llm_priority(PRIORITY_IN_PROGRESS):
+        return await jury_node(state, jury_prompt, "Jury", config)
+
+
+def route_start(state, config):
+    if config["configurable"].get("parallel_openings") and state["turn_count"] == 0:
+        return "Openings"
+    return route_step(state)
+
+
+def route_step(state):
+    if state["turn_count"] >= MAX_TURNS or state.get("stop_reason"):
+        return "Jury"
+    return state["current_speaker"]
+
+
+def build_workflow():
+    workflow = StateGraph(GraphState)
+
+    workflow.add_node("Champion", champion_node)
+    workflow.add_node("Challenger", challenger_node)
+    workflow.add_node("Openings", openings_node)
+    workflow.add_node("Jury", jury_step)
+
+    routes = {"Champion": "Champion", "Challenger": "Challenger", "Jury": "Jury"}
+    workflow.add_conditional_edges("Champion", route_step, routes)
+    workflow.add_conditional_edges("Challenger", route_step, routes)
+    workflow.add_conditional_edges("Openings", route_step, routes)
+
+    # With parallel_openings set in the run config, round 1 is both opening statements at once
+    workflow.set_conditional_entry_point(route_start, {**routes, "Openings": "Openings"})
+    workflow.add_edge("Jury", END)
+
+    return workflow.compile()
+
+
+def get_debate_workflow():
+    """The compiled debate graph; nodes read the topic from the state and everything else from the config."""
+    return registry.get_or_build(
+        ("workflow", fingerprint(champion_prompt + challenger_prompt + jury_prompt)), build_workflow
+    )
+
+
+async def load_debate(config, checkpointer) -> Dict:
+    """The last checkpointed state of the debate thread in ``config``, or ``{}`` if it never ran."""
+    snapshot = await get_debate_workflow().copy(update={"checkpointer": checkpointer}).aget_state(config)
+    return snapshot.values
+
+
+@traced
+async def run_debate(topic: str, config, checkpointer) -> Dict:
+    """Run (or resume) the debate thread in ``config`` to completion and return its final state.
+
+    If the thread already has checkpoints, finished turns are replayed to the view
+    and the graph continues from the last one instead of starting over.
+    """
+    runner = get_debate_workflow().copy(update={"checkpointer": checkpointer})
+    config = with_metrics(with_search_slots(with_evidence_pool(config)))
+    view = get_view(config)
+    saved_state = (await runner.aget_state(config)).values
+    state = saved_state or initial_state(topic)
+    # Search results are filed in the evidence store under the debate's topic
+    config = {**config, "configurable": {**config["configurable"], "topic": state["topic"]}}
+
+    for turn in state["transcript"]:
+        view.replay_turn(turn)
+    if state.get("stop_reason"):
+        view.ended_early(state["stop_reason"], MAX_TURNS - len(state["transcript"]))
+    if state.get("result"):
+        view.start_jury()
+        for section in state["result"]:
+            view.jury_section(section)
+        return state
+
+    # A None input continues the thread from its last checkpoint instead of starting over
+    inputs = None if saved_state else state
+    # MEMORY_PROFILE (or the page's admin toggle) compares allocation snapshots between turns
+    profile = config["configurable"].get("memory_profile") or memory_profiling_enabled()
+    profiler = MemoryProfiler(config["configurable"]["thread_id"]) if profile else None
+    logged_turns = len(state["transcript"])
+    try:
+        async for state in runner.astream(inputs, config, stream_mode="values"):
+            # Only the newest turn goes to the (opt-in) transcript sink, never the whole history again
+            for turn in state["transcript"][logged_turns:]:
+                log_transcript(debate_id(config), turn)
+            logged_turns = len(state["transcript"])
+            log_event(
+                "debate_step", debate_id=debate_id(config), turn=state["turn_count"],
+                next_speaker=state["current_speaker"], transcript_chars=sum(len(t.text) for t in state["transcript"]),
+            )
+            if profiler:
+                label = "verdict" if state.get("result") else f"turn {state['turn_count']}" if state["turn_count"] else "start"
+                profiler.snapshot(label)
+    finally:
+        if profiler:
+            profiler.close()
+
+    pool = config["configurable"].get("evidence_pool")
+    log_event(
+        "debate_finished",
+        debate_id=debate_id(config),
+        turns=len(state["transcript"]),
+        turns_saved=MAX_TURNS - len(state["transcript"]),
+        stop_reason=state.get("stop_reason"),
+        prompt_tokens=[turn.prompt_tokens for turn in state["transcript"]],
+        timings=config["configurable"]["metrics"].summary(),
+        search_cache=get_search_cache().stats(),
+        evidence_prefetch=pool.stats() if pool else None,
+        scheduler=get_scheduler().stats(),
+        clients=get_client_pool().stats(),
+        response_cache=get_response_cache().stats() if get_response_cache() else None,
+        evidence_store=get_evidence_store().stats() if get_evidence_store() else None,
+    )
+    return state
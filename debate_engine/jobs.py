@@ -0,0 +1,255 @@
+import asyncio
+import functools
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from debate_engine.logs import log_event
+from debate_engine.metrics import TimedWriter
+from debate_engine.transcript import Turn
+from debate_engine.view import DebateView, TurnWriter
+
+Event = Tuple[str, Any]
+
+
+class EventWriter(TurnWriter):
+    """Records one turn's tokens as job events instead of drawing them."""
+
+    def __init__(self, job: "DebateJob", key: int):
+        super().__init__()
+        self.job = job
+        self.key = key
+
+    def write(self, text: str) -> None:
+        self.text += text
+        self.job.emit("text", (self.key, text))
+
+    def flush(self) -> None:
+        self.job.emit("flush", self.key)
+
+
+class RecordingView(DebateView):
+    """The view a background debate runs with: every hook becomes an event in the job's log."""
+
+    def __init__(self, job: "DebateJob"):
+        self.job = job
+        self._keys = itertools.count()
+
+    def start_turn(self, name: str, round_num: int) -> TurnWriter:
+        key = next(self._keys)
+        self.job.emit("turn", (key, name, round_num))
+        return EventWriter(self.job, key)
+
+    def start_openings(self, names: List[str]) -> List[TurnWriter]:
+        keys = [next(self._keys) for _ in names]
+        self.job.emit("openings", list(zip(keys, names)))
+        return [EventWriter(self.job, key) for key in keys]
+
+    def replay_turn(self, turn: Turn) -> None:
+        self.job.emit("replay", turn)
+
+    def ended_early(self, reason: str, turns_saved: int) -> None:
+        self.job.emit("ended_early", (reason, turns_saved))
+
+    def start_jury(self) -> None:
+        self.job.emit("jury", None)
+
+    def jury_section(self, section: Dict[str, str]) -> None:
+        self.job.emit("section", section)
+
+
+class DebateJob:
+    """One debate owned by the job manager, with the ordered log of everything its view was asked to show.
+
+    Any number of sessions can read the log at once, from the start or from an
+    offset, while the debate is still running; the log ends with a ``done`` or
+    ``failed`` event.
+    """
+
+    def __init__(self, debate_id: str, topic: str, config):
+        self.debate_id = debate_id
+        self.topic = topic
+        self.config = config
+        self.metrics = config["configurable"].get("metrics")
+        self.events: List[Event] = []
+        self.result: Optional[List[Dict[str, str]]] = None
+        self.error: Optional[str] = None
+        self.started = time.time()
+        self.finished: Optional[float] = None
+        self._changed = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.finished is not None
+
+    def emit(self, kind: str, payload: Any = None) -> None:
+        with self._changed:
+            self.events.append((kind, payload))
+            self._changed.notify_all()
+
+    def finish(self, result=None, error: Optional[str] = None) -> None:
+        with self._changed:
+            self.result = result
+            self.error = error
+            self.finished = time.time()
+            self.events.append(("failed", error) if error else ("done", result))
+            self._changed.notify_all()
+
+    def subscribe(self, since: int = 0, timeout: Optional[float] = None) -> Iterator[Event]:
+        """Yield events from index ``since`` onwards, waiting for new ones until the job ends.
+
+        With ``timeout``, gives up after that many seconds without a new event.
+        """
+        position = since
+        while True:
+            with self._changed:
+                if position >= len(self.events) and not self.done:
+                    if not self._changed.wait(timeout) and position >= len(self.events):
+                        return
+                batch = self.events[position:]
+                finished = self.done
+            position += len(batch)
+            yield from batch
+            if finished and position >= len(self.events):
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "debate_id": self.debate_id,
+            "events": len(self.events),
+            "done": self.done,
+            "failed": bool(self.error),
+            "seconds": round((self.finished or time.time()) - self.started, 3),
+        }
+
+
+def _rendered(job: DebateJob, name: str, round_num: int, writer: TimedWriter) -> None:
+    # A turn's last event is its flush, so this is when the view has finished drawing it
+    if job.metrics:
+        stats = job.metrics.record_render(name, round_num, writer)
+    else:
+        stats = {"render_time": round(writer.render_time, 4), **writer.stats()}
+    log_event("turn_rendered", debate_id=job.debate_id, speaker=name, round=round_num, **stats)
+
+
+def follow(job: DebateJob, view: DebateView, since: int = 0) -> int:
+    """Draw ``job`` into ``view`` as it runs (or replay it if it has finished); returns the events drawn.
+
+    The time the view spends drawing each turn, and its update and byte counts,
+    are logged as ``turn_rendered`` and recorded in the job's metrics.
+    """
+    writers: Dict[int, TimedWriter] = {}
+    turns: Dict[int, Tuple[str, int]] = {}
+    drawn = since
+    for kind, payload in job.subscribe(since):
+        drawn += 1
+        if kind == "turn":
+            key, name, round_num = payload
+            writers[key] = TimedWriter(view.start_turn(name, round_num))
+            turns[key] = (name, round_num)
+        elif kind == "openings":
+            keys, names = zip(*payload)
+            writers.update(zip(keys, map(TimedWriter, view.start_openings(list(names)))))
+            turns.update((key, (name, 1)) for key, name in zip(keys, names))
+        elif kind == "text":
+            key, text = payload
+            writers[key].write(text)
+        elif kind == "flush":
+            writers[payload].flush()
+            _rendered(job, *turns[payload], writers[payload])
+        elif kind == "replay":
+            view.replay_turn(payload)
+        elif kind == "ended_early":
+            view.ended_early(*payload)
+        elif kind == "jury":
+            view.start_jury()
+        elif kind == "section":
+            view.jury_section(payload)
+    return drawn
+
+
+class JobManager:
+    """Runs debates on one background event loop, independent of any page session.
+
+    A debate keeps going when the browser that started it reruns or disconnects;
+    any session can find it again by id and redraw it from its event log. At most
+    ``max_running`` debates are in progress at once (the rest wait their turn), and
+    the logs of the last ``history`` finished debates are kept so viewing them again
+    costs nothing. Older ones are still replayed for free from their checkpoints.
+    """
+
+    def __init__(self, max_running: int = 8, history: int = 32):
+        self.max_running = max_running
+        self.history = history
+        self._jobs: "OrderedDict[str, DebateJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._thread = threading.Thread(target=self._loop.run_forever, name="debate-jobs", daemon=True)
+        self._thread.start()
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run ``coro`` on the job loop and wait for its result (e.g. loading a saved debate)."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def get(self, debate_id: str) -> Optional[DebateJob]:
+        with self._lock:
+            return self._jobs.get(debate_id)
+
+    def submit(self, debate_id: str, topic: str, config) -> DebateJob:
+        """Start (or resume from its checkpoint) the debate ``debate_id``; if it is already running, return that job."""
+        with self._lock:
+            job = self._jobs.get(debate_id)
+            if job and not job.error:
+                return job
+            job = DebateJob(debate_id, topic, config)
+            self._jobs[debate_id] = job
+            self._jobs.move_to_end(debate_id)
+            self._evict()
+        asyncio.run_coroutine_threadsafe(self._run(job), self._loop)
+        log_event("job_submitted", debate_id=debate_id, running=self.stats()["running"])
+        return job
+
+    def _evict(self) -> None:
+        finished = [debate_id for debate_id, job in self._jobs.items() if job.done]
+        for debate_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[debate_id]
+
+    async def _run(self, job: DebateJob) -> None:
+        # Imported here so that looking up or following a job does not load the graph, model clients or langsmith
+        from debate_engine.checkpoints import open_checkpointer
+        from debate_engine.graph import run_debate
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_running)
+        configurable = {**job.config["configurable"], "view": RecordingView(job)}
+        config = {**job.config, "configurable": configurable}
+        async with self._slots:
+            try:
+                async with open_checkpointer() as checkpointer:
+                    state = await run_debate(job.topic, config, checkpointer)
+                job.finish(state.get("result"))
+            except Exception as e:
+                logging.exception(f"Debate {job.debate_id} failed: {str(e)}")
+                job.finish(error=str(e))
+        log_event("job_finished", **job.stats())
+        with self._lock:
+            self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {"running": sum(not job.done for job in jobs), "finished": sum(job.done for job in jobs)}
+
+
+@functools.lru_cache(maxsize=None)
+def get_job_manager() -> JobManager:
+    """The process-wide job manager, sized by ``DEBATE_JOB_WORKERS`` and ``DEBATE_JOB_HISTORY``."""
+    return JobManager(
+        max_running=int(os.environ.get("DEBATE_JOB_WORKERS", 8)),
+        history=int(os.environ.get("DEBATE_JOB_HISTORY", 32)),
+    )
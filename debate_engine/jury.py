@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+Section = Dict[str, str]
+
+
+def parse_section(block: str):
+    if ":" not in block:
+        return None
+    title, content = block.split(":", 1)
+    return {"title": title.strip(), "content": content.strip()}
+
+
+class VerdictParser:
+    """Builds ``{"title", "content"}`` jury sections incrementally from a token stream.
+
+    Sections are separated by blank lines, as the jury prompt asks; each one is
+    returned by ``feed`` as soon as the blank line after it arrives, so the UI can
+    show it while the rest of the verdict is still being written.
+    """
+
+    def __init__(self):
+        self.sections: List[Section] = []
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[Section]:
+        self._buffer += text
+        finished = []
+        while "\n\n" in self._buffer:
+            block, self._buffer = self._buffer.split("\n\n", 1)
+            section = parse_section(block)
+            if section:
+                finished.append(section)
+        self.sections.extend(finished)
+        return finished
+
+    def close(self) -> List[Section]:
+        section = parse_section(self._buffer)
+        self._buffer = ""
+        if not section:
+            return []
+        self.sections.append(section)
+        return [section]
+
+
+def parse_verdict(text: str) -> List[Section]:
+    parser = VerdictParser()
+    parser.feed(text)
+    parser.close()
+    return parser.sections
+
+
+def find_winner(sections: List[Section]) -> Optional[str]:
+    """Read "Champion" or "Challenger" out of the verdict's winner section."""
+    for section in sections:
+        if "🏆" in section["title"] or "winner" in section["title"].lower():
+            content = section["content"].lower()
+            positions = {role: content.find(role.lower()) for role in ("Champion", "Challenger")}
+            named = {role: pos for role, pos in positions.items() if pos >= 0}
+            return min(named, key=named.get) if named else None
+    return None
+
+
+@dataclass
+class Judge:
+    name: str
+    llm: Any
+    weight: float = 1.0
+
+
+@dataclass
+class JudgeVerdict:
+    judge: str
+    sections: List[Section]
+    winner: Optional[str]
+    latency: float
+    error: Optional[str] = None
+
+
+@dataclass
+class PanelResult:
+    winner: Optional[str]
+    votes: Dict[str, float]
+    agreement: float
+    verdicts: List[JudgeVerdict]
+    wall_time: float
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "winner": self.winner,
+            "votes": self.votes,
+            "agreement": round(self.agreement, 2),
+            "wall_time": round(self.wall_time, 2),
+            "slowest_judge": round(max((v.latency for v in self.verdicts), default=0.0), 2),
+            "judges": {v.judge: {"winner": v.winner, "latency": round(v.latency, 2), "error": v.error} for v in self.verdicts},
+        }
+
+
+def parse_panel_spec(spec: str) -> List[Tuple[str, float, float]]:
+    """Parse ``JURY_PANEL``, e.g. ``"gpt-4:0.3,gpt-4:0.7,gpt-4o-mini:0.5:0.5"`` (model:temperature[:weight])."""
+    judges = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        model, temperature, *weight = entry.split(":")
+        judges.append((model, float(temperature), float(weight[0]) if weight else 1.0))
+    return judges
+
+
+async def run_jury_panel(judges: List[Judge], prompt: str, config=None, max_concurrency: int = 4) -> PanelResult:
+    """Ask every judge concurrently (at most ``max_concurrency`` at a time) and combine their votes."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def deliberate(judge: Judge) -> JudgeVerdict:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await judge.llm.ainvoke(prompt, config=config)
+            except Exception as e:
+                logging.error(f"{judge.name} failed: {str(e)}")
+                return JudgeVerdict(judge.name, [], None, time.perf_counter() - start, error=str(e))
+            sections = parse_verdict(response.content)
+            return JudgeVerdict(judge.name, sections, find_winner(sections), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    verdicts = await asyncio.gather(*(deliberate(judge) for judge in judges))
+    wall_time = time.perf_counter() - start
+
+    votes: Dict[str, float] = {}
+    for judge, verdict in zip(judges, verdicts):
+        if verdict.winner:
+            votes[verdict.winner] = votes.get(verdict.winner, 0.0) + judge.weight
+    # Weighted majority; on an exact tie the earliest judge's pick wins, since no ties are allowed
+    first_pick = {v.winner: i for i, v in reversed(list(enumerate(verdicts))) if v.winner}
+    winner = max(votes, key=lambda role: (votes[role], -first_pick[role])) if votes else None
+    voted = [v for v in verdicts if v.winner]
+    agreement = sum(v.winner == winner for v in voted) / len(voted) if voted else 0.0
+    return PanelResult(winner, votes, agreement, list(verdicts), wall_time)
+
+
+def panel_sections(result: PanelResult) -> List[Section]:
+    """Verdict sections for the UI: the panel's winner and vote, then the reasoning of a judge who agreed."""
+    tally = " · ".join(f"{role} {votes:g}" for role, votes in sorted(result.votes.items(), key=lambda kv: -kv[1]))
+    sections = [
+        {"title": "🏆 Winner", "content": result.winner or "No decision"},
+        {"title": "⚖️ Panel Vote", "content": f"{tally} ({result.agreement:.0%} agreement)"},
+    ]
+    for verdict in result.verdicts:
+        if verdict.winner == result.winner:
+            sections += [s for s in verdict.sections if "🏆" not in s["title"] and "winner" not in s["title"].lower()]
+            break
+    return sections
+
+
+def make_jury_panel(spec: str, api_key: str) -> List[Judge]:
+    """Build the judges described by a ``JURY_PANEL`` spec; an empty spec means a single streaming judge."""
+    from debate_engine.clients import get_chat_model
+
+    return [
+        Judge(
+            f"Judge {i + 1} ({model} @ {temperature})",
+            get_chat_model(api_key, model=model, temperature=temperature, streaming=False),
+            weight,
+        )
+        for i, (model, temperature, weight) in enumerate(parse_panel_spec(spec))
+    ]
@@ -0,0 +1,104 @@
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("debate_engine")
+
+# Full turn text only goes here, and only when DEBATE_TRANSCRIPT_LOG names a file for it
+transcript_logger = logging.getLogger("debate_engine.transcript")
+transcript_logger.propagate = False
+transcript_logger.setLevel(logging.CRITICAL + 1)
+
+
+class Event:
+    """A structured log message; it is only turned into text if a handler actually emits it."""
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name: str, fields: Dict[str, Any]):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join([self.name] + [f"{key}={value}" for key, value in self.fields.items()])
+
+
+def log_event(name: str, level: int = logging.INFO, **fields) -> None:
+    """Log an event record such as ``turn_finished`` with its fields (debate id, turn, sizes, timings)."""
+    if logger.isEnabledFor(level):
+        logger.log(level, Event(name, fields))
+
+
+def log_transcript(debate_id: str, turn) -> None:
+    """Send one finished turn's text to the opt-in transcript sink."""
+    if transcript_logger.isEnabledFor(logging.DEBUG):
+        transcript_logger.debug(
+            Event("turn_text", {"debate_id": debate_id, "speaker": turn.role, "round": turn.round, "text": turn.text})
+        )
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        if isinstance(record.msg, Event):
+            payload["event"] = record.msg.name
+            payload.update(record.msg.fields)
+        else:
+            payload["message"] = record.getMessage()
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queues the record untouched, so formatting happens on the listener thread and not in the debate loop.
+
+    The stock ``QueueHandler.prepare`` formats the message in the caller so the
+    record can be pickled; our queue never leaves the process.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _queued(handler: logging.Handler) -> QueueHandler:
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return DeferredQueueHandler(records)
+
+
+@functools.lru_cache(maxsize=None)
+def configure_logging(level: Optional[str] = None) -> None:
+    """Send all logging through a background thread; call once at startup (repeat calls do nothing).
+
+    ``LOG_LEVEL`` (default INFO) gates what is emitted and ``LOG_FORMAT=json``
+    writes one JSON object per line. Transcript text is only logged when
+    ``DEBATE_TRANSCRIPT_LOG`` names a file to write it to.
+    """
+    stream = logging.StreamHandler()
+    if os.environ.get("LOG_FORMAT", "text").lower() == "json":
+        stream.setFormatter(JsonFormatter())
+    else:
+        stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    root = logging.getLogger()
+    root.setLevel((level or os.environ.get("LOG_LEVEL", "INFO")).upper())
+    root.addHandler(_queued(stream))
+
+    transcript_path = os.environ.get("DEBATE_TRANSCRIPT_LOG")
+    if transcript_path:
+        sink = logging.FileHandler(transcript_path, encoding="utf-8")
+        sink.setFormatter(JsonFormatter())
+        transcript_logger.addHandler(_queued(sink))
+        transcript_logger.setLevel(logging.DEBUG)
@@ -0,0 +1,224 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from debate_engine.transcript import count_tokens
+from debate_engine.view import TurnWriter
+
+SECONDS_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+RATE_BUCKETS = (1, 5, 10, 20, 40, 80, 160)
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms in the Prometheus text format, without the client library."""
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._histograms: Dict[Tuple[str, Tuple], Tuple[Tuple[float, ...], List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets=SECONDS_BUCKETS, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            bounds, counts, total = self._histograms.setdefault(key, (buckets, [0] * len(buckets), [0.0, 0]))
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    counts[i] += 1
+            total[0] += value
+            total[1] += 1
+
+    def render(self) -> str:
+        def fmt(labels, extra=()):
+            pairs = [f'{k}="{v}"' for k, v in list(labels) + list(extra)]
+            return "{" + ",".join(pairs) + "}" if pairs else ""
+
+        lines = []
+        typed = set()
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name}{fmt(labels)} {value:g}")
+            for (name, labels), (bounds, counts, (total, count)) in sorted(self._histograms.items()):
+                if name not in typed:
+                    typed.add(name)
+                    lines.append(f"# TYPE {name} histogram")
+                for bound, bucket in zip(bounds, counts):
+                    lines.append(f"{name}_bucket{fmt(labels, [('le', f'{bound:g}')])} {bucket}")
+                lines.append(f"{name}_bucket{fmt(labels, [('le', '+Inf')])} {count}")
+                lines.append(f"{name}_sum{fmt(labels)} {total:g}")
+                lines.append(f"{name}_count{fmt(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+class JsonlMetricsSink:
+    """Appends one JSON line per recorded span."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+@functools.lru_cache(maxsize=None)
+def get_metrics_sink() -> Optional[JsonlMetricsSink]:
+    path = os.environ.get("METRICS_PATH")
+    return JsonlMetricsSink(path) if path else None
+
+
+@functools.lru_cache(maxsize=None)
+def start_metrics_server(port: int) -> ThreadingHTTPServer:
+    """Serve ``metrics_registry`` at ``http://0.0.0.0:<port>/metrics`` from a background thread (once per process)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics_registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logging.info(f"Serving debate metrics on port {port}")
+    return server
+
+
+@dataclass
+class Span:
+    kind: str
+    name: str
+    # Seconds since the debate (run) started
+    start: float
+    duration: float
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+class DebateMetrics:
+    """Timing spans for one debate run: agent turns, the jury, and every search.
+
+    Each span also updates the process-wide ``metrics_registry`` and, with
+    ``METRICS_PATH`` set, is appended to that JSONL file. ``spans`` is what the
+    page draws as the timing waterfall.
+    """
+
+    def __init__(self, debate_id: str):
+        self.debate_id = debate_id
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        port = os.environ.get("METRICS_PORT")
+        if port:
+            try:
+                start_metrics_server(int(port))
+            except OSError as e:
+                logging.warning(f"Could not serve metrics on port {port}: {str(e)}")
+
+    def record(self, kind: str, name: str, start: float, end: float, **attrs) -> Span:
+        """Record a span between two ``time.perf_counter()`` readings."""
+        span = Span(kind, name, round(start - self.started, 4), round(end - start, 4), attrs)
+        with self._lock:
+            self.spans.append(span)
+        labels = {key: attrs[key] for key in ("role", "source") if key in attrs}
+        metrics_registry.observe(f"debate_{kind}_seconds", span.duration, **labels)
+        sink = get_metrics_sink()
+        if sink:
+            sink.write({"debate_id": self.debate_id, **asdict(span)})
+        return span
+
+    def record_turn(self, role: str, round_num: int, writer: "TimedWriter", prompt_tokens: int) -> Span:
+        end = time.perf_counter()
+        completion_tokens = count_tokens(writer.text)
+        ttft = (writer.first_token - writer.started) if writer.first_token else None
+        streaming_time = end - writer.first_token if writer.first_token else 0.0
+        tokens_per_second = completion_tokens / streaming_time if streaming_time > 0 else None
+        metrics_registry.inc("debate_prompt_tokens_total", prompt_tokens, role=role)
+        metrics_registry.inc("debate_completion_tokens_total", completion_tokens, role=role)
+        if ttft is not None:
+            metrics_registry.observe("debate_ttft_seconds", ttft, role=role)
+        if tokens_per_second is not None:
+            metrics_registry.observe("debate_tokens_per_second", tokens_per_second, buckets=RATE_BUCKETS, role=role)
+        return self.record(
+            "turn", f"{role} round {round_num}", writer.started, end,
+            role=role, round=round_num, ttft=round(ttft, 3) if ttft is not None else None,
+            tokens_per_second=round(tokens_per_second, 1) if tokens_per_second else None,
+            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+        )
+
+    def record_render(self, role: str, round_num: int, writer: "TimedWriter") -> Dict[str, Any]:
+        """Record how long a view took to draw one turn, and how many updates and bytes it sent."""
+        stats = {"render_time": round(writer.render_time, 4), **writer.stats()}
+        metrics_registry.observe("debate_render_seconds", writer.render_time, role=role)
+        metrics_registry.inc("debate_renders_total", stats.get("renders", 0), role=role)
+        metrics_registry.inc("debate_render_bytes_total", stats.get("bytes_sent", 0), role=role)
+        sink = get_metrics_sink()
+        if sink:
+            sink.write({"debate_id": self.debate_id, "kind": "render", "name": f"{role} round {round_num}", **stats})
+        return stats
+
+    def summary(self) -> Dict[str, Any]:
+        """Total seconds and span count per kind, plus the run's wall time."""
+        with self._lock:
+            spans = list(self.spans)
+        totals: Dict[str, Dict[str, float]] = {}
+        for span in spans:
+            total = totals.setdefault(span.kind, {"count": 0, "seconds": 0.0})
+            total["count"] += 1
+            total["seconds"] = round(total["seconds"] + span.duration, 3)
+        return {"wall_time": round(time.perf_counter() - self.started, 3), **totals}
+
+
+class TimedWriter(TurnWriter):
+    """Wraps a view's writer to time the first token and the time spent rendering."""
+
+    def __init__(self, inner: TurnWriter):
+        self.inner = inner
+        self.started = time.perf_counter()
+        self.first_token: Optional[float] = None
+        self.render_time = 0.0
+
+    @property
+    def text(self) -> str:
+        return self.inner.text
+
+    def write(self, text: str) -> None:
+        now = time.perf_counter()
+        if self.first_token is None and text.strip():
+            self.first_token = now
+        self.inner.write(text)
+        self.render_time += time.perf_counter() - now
+
+    def flush(self) -> None:
+        now = time.perf_counter()
+        self.inner.flush()
+        self.render_time += time.perf_counter() - now
+
+    def stats(self) -> Dict[str, int]:
+        return self.inner.stats()
@@ -0,0 +1,171 @@
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from debate_engine.search_cache import SearchResults, normalize_query
+
+# Searches started ahead of time for every debate in the process share these threads
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="evidence-prefetch")
+
+STOPWORDS = frozenset(
+    "a about after all also an and any are as at be because been but by can could did do does for from had has "
+    "have how if in into is it its more most must no not of on or our should so such than that the their them "
+    "then there these they this those to too under was we were what when where which while who why will with "
+    "would you your better worse really very just only even much many show shows make makes one like".split()
+)
+
+# What the next speaker is likely to look for, by role
+ROLE_ANGLES = {"Champion": "benefits evidence", "Challenger": "criticism evidence"}
+
+
+def keywords(text: str) -> List[str]:
+    """Content words of ``text`` in order of first appearance."""
+    seen = []
+    for word in re.findall(r"[a-z0-9][a-z0-9'-]+", text.lower()):
+        if word not in STOPWORDS and word not in seen and not word.startswith("http"):
+            seen.append(word)
+    return seen
+
+
+def candidate_queries(topic: str, text: str, role: str, limit: int = 3) -> List[str]:
+    """Searches ``role`` is likely to run next, from the topic and what the other side has said so far.
+
+    Without text the guess comes from the topic alone; otherwise the sentences of
+    ``text`` that carry the most content words (claims, figures) are paired with
+    the topic's key terms, since the reply will usually go after those claims.
+    """
+    topic_words = keywords(topic)[:4]
+    queries = [" ".join(topic_words + [ROLE_ANGLES.get(role, "evidence")])] if not text else []
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    scored = []
+    for sentence in sentences:
+        words = [w for w in keywords(sentence) if w not in topic_words]
+        if len(words) >= 3:
+            scored.append((len(words) + 2 * bool(re.search(r"\d", sentence)), words))
+    for _, words in sorted(scored, key=lambda item: -item[0]):
+        queries.append(" ".join(topic_words[:2] + words[:5]))
+    return queries[:limit]
+
+
+def similarity(a: str, b: str) -> float:
+    """Jaccard overlap of the two queries' content words.
+
+    Relative to the union, not the shorter query, so a short query ("AutoML") does
+    not match a longer prefetched one that merely contains its word.
+    """
+    words_a, words_b = set(keywords(a)), set(keywords(b))
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+class EvidencePool:
+    """Search results fetched in the background for a debate, before the agents ask for them.
+
+    ``prefetch`` starts a search on a worker thread; ``lookup`` answers a tool call
+    from the pool when a prefetched query is the same or close enough (by
+    ``similarity``), waiting for it if it is still in flight. Every debate has its
+    own pool; ``search`` is the (cached) search function the tool would have used.
+    """
+
+    def __init__(self, search: Callable[[str, int], SearchResults], match_threshold: float = 0.6,
+                 wait_timeout: float = 10):
+        self.search = search
+        self.match_threshold = match_threshold
+        self.wait_timeout = wait_timeout
+        self.prefetched = 0
+        self.lookups = 0
+        self.hits = 0
+        self.latency_saved = 0.0
+        # normalized query -> (num_results, future of (results, seconds the search took), whether it was used)
+        self._entries: Dict[str, Tuple[int, Future, bool]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, query: str, num_results: int = 3) -> bool:
+        """Start searching for ``query`` unless the pool already has it; returns whether a search started."""
+        key = normalize_query(query)
+        with self._lock:
+            if not key or key in self._entries:
+                return False
+            future = _executor.submit(self._timed_search, query, num_results)
+            self._entries[key] = (num_results, future, False)
+            self.prefetched += 1
+        return True
+
+    def _timed_search(self, query: str, num_results: int) -> Tuple[SearchResults, float]:
+        start = time.perf_counter()
+        return self.search(query, num_results), time.perf_counter() - start
+
+    def _match(self, query: str, num_results: int) -> Optional[str]:
+        key = normalize_query(query)
+        if key in self._entries and self._entries[key][0] >= num_results:
+            return key
+        scored = [(similarity(query, other), other) for other, (n, _, _) in self._entries.items() if n >= num_results]
+        best = max(scored, default=(0.0, None))
+        return best[1] if best[0] >= self.match_threshold else None
+
+    def lookup(self, query: str, num_results: int = 3) -> Optional[SearchResults]:
+        with self._lock:
+            self.lookups += 1
+            key = self._match(query, num_results)
+            if key is None:
+                return None
+            stored_n, future, _ = self._entries[key]
+            self._entries[key] = (stored_n, future, True)
+
+        start = time.perf_counter()
+        try:
+            results, took = future.result(timeout=self.wait_timeout)
+        except Exception as e:
+            logging.warning(f"Prefetched search for {key!r} failed: {str(e)}")
+            return None
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.hits += 1
+            self.latency_saved += max(0.0, took - waited)
+        return results[:num_results]
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "prefetched": self.prefetched,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+                "unused": sum(not used for _, _, used in self._entries.values()),
+                "latency_saved": round(self.latency_saved, 2),
+            }
+
+
+class TurnPrefetcher:
+    """Feeds the pool with the next speaker's likely searches while the current one is still streaming.
+
+    Candidates are planned at the start of the turn and again each time a
+    paragraph finishes, up to ``budget`` searches per turn.
+    """
+
+    def __init__(self, pool: Optional[EvidencePool], topic: str, next_role: str, budget: int = 3):
+        self.pool = pool
+        self.topic = topic
+        self.next_role = next_role
+        self.budget = budget if pool else 0
+        self._paragraphs = -1
+
+    def observe(self, text: str) -> None:
+        paragraphs = text.count("\n\n")
+        if paragraphs != self._paragraphs:
+            self._paragraphs = paragraphs
+            self._plan(text.rsplit("\n\n", 1)[0] if paragraphs else "")
+
+    def finish(self, text: str) -> None:
+        self._plan(text)
+
+    def _plan(self, text: str) -> None:
+        if self.budget <= 0:
+            return
+        for query in candidate_queries(self.topic, text, self.next_role, limit=10):
+            if self.budget > 0 and self.pool.prefetch(query):
+                self.budget -= 1
@@ -0,0 +1,109 @@
+import logging
+import os
+import threading
+import tracemalloc
+from typing import List, Optional
+
+logger = logging.getLogger("debate_engine.memory")
+
+_lock = threading.Lock()
+_active_profilers = 0
+_started_tracing = False
+_sampler: Optional["RssSampler"] = None
+
+# Allocations made by the profiler itself or the import machinery only add noise to the diffs
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def memory_profiling_enabled() -> bool:
+    return os.environ.get("MEMORY_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process; falls back to the peak RSS where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class RssSampler(threading.Thread):
+    """Logs the process RSS every ``interval`` seconds, so growth in long-running pods shows up in the logs."""
+
+    def __init__(self, interval: float):
+        super().__init__(name="rss-sampler", daemon=True)
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+            logger.info("rss_mb=%.1f traced_mb=%.1f", rss_bytes() / 2**20, traced / 2**20)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+class MemoryProfiler:
+    """Allocation snapshots for one debate, compared turn by turn.
+
+    Creating a profiler starts tracemalloc (and the RSS sampler) if they are not
+    running yet; closing the last one stops whatever it started, so normal
+    traffic pays nothing once profiling is switched off again. Each ``snapshot``
+    logs the ``top_n`` allocation sites that grew most since the previous one.
+    """
+
+    def __init__(self, debate_id: str, top_n: Optional[int] = None):
+        global _active_profilers, _started_tracing, _sampler
+        self.debate_id = debate_id
+        self.top_n = top_n or int(os.environ.get("MEMORY_PROFILE_TOP", 10))
+        with _lock:
+            _active_profilers += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(int(os.environ.get("MEMORY_PROFILE_FRAMES", 1)))
+                _started_tracing = True
+            interval = float(os.environ.get("MEMORY_RSS_INTERVAL", 30))
+            if _sampler is None and interval > 0:
+                _sampler = RssSampler(interval)
+                _sampler.start()
+        self._previous = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        self._closed = False
+
+    def snapshot(self, label: str) -> List[str]:
+        """Log and return the largest allocation growth since the last snapshot."""
+        current = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        diff = [str(stat) for stat in current.compare_to(self._previous, "lineno")[: self.top_n]]
+        self._previous = current
+        traced, peak = tracemalloc.get_traced_memory()
+        logger.info(
+            "debate=%s snapshot=%r traced_mb=%.1f peak_mb=%.1f rss_mb=%.1f",
+            self.debate_id, label, traced / 2**20, peak / 2**20, rss_bytes() / 2**20,
+        )
+        for line in diff:
+            logger.info("debate=%s snapshot=%r %s", self.debate_id, label, line)
+        return diff
+
+    def close(self) -> None:
+        global _active_profilers, _started_tracing, _sampler
+        if self._closed:
+            return
+        self._closed = True
+        self._previous = None
+        with _lock:
+            _active_profilers -= 1
+            if _active_profilers or memory_profiling_enabled():
+                return
+            if _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+            if _sampler is not None:
+                _sampler.stop()
+                _sampler = None
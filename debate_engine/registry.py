@@ -0,0 +1,75 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Sequence, Tuple
+
+from langgraph.prebuilt import create_react_agent
+
+
+class GraphRegistry:
+    """Process-wide, LRU-bounded store of compiled graphs, keyed by everything they were built from.
+
+    Compiling a ReAct agent or the debate ``StateGraph`` is pure setup work, so each
+    distinct configuration is built once and then shared by every turn and session.
+    Agents are keyed by their model, which includes the user's API key, so only the
+    ``max_graphs`` most recently used are kept; each one holds on to its model client.
+    """
+
+    def __init__(self, max_graphs: int = 256):
+        self.max_graphs = max_graphs
+        self._graphs: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                self.hits += 1
+                return graph
+            graph = factory()
+            self._graphs[key] = graph
+            self.builds += 1
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+                self.evictions += 1
+            return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"graphs": len(self._graphs), "builds": self.builds, "hits": self.hits, "evictions": self.evictions}
+
+
+# Room for both agents of every pooled model client (LLM_CLIENT_POOL_SIZE) plus the debate workflow
+registry = GraphRegistry(max_graphs=int(os.environ.get("GRAPH_REGISTRY_SIZE", 256)))
+
+
+def fingerprint(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def model_key(llm) -> Tuple:
+    """Identify a chat model by its class, model name, sampling params and (hashed) API key."""
+    api_key = getattr(llm, "openai_api_key", None)
+    if api_key is not None and hasattr(api_key, "get_secret_value"):
+        api_key = api_key.get_secret_value()
+    return (
+        type(llm).__name__,
+        getattr(llm, "model_name", None),
+        getattr(llm, "temperature", None),
+        fingerprint(api_key) if api_key else None,
+    )
+
+
+def get_react_agent(role: str, llm, prompt: str, tools: Sequence):
+    """Return the compiled ReAct agent for this role, model, prompt and tool set."""
+    key = ("agent", role, model_key(llm), fingerprint(prompt), tuple(t.name for t in tools))
+    return registry.get_or_build(key, lambda: create_react_agent(llm, tools=tools, prompt=prompt))
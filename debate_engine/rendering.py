@@ -0,0 +1,58 @@
+import os
+import time
+from typing import Dict, Optional
+
+import streamlit as st
+
+from debate_engine.view import TurnWriter
+
+
+class StreamRenderer(TurnWriter):
+    """Coalesces streamed tokens into throttled, mostly append-only Streamlit updates.
+
+    The header is sent once as its own element. Body text is flushed at most
+    ``fps`` times a second, or sooner once ``flush_bytes`` of new text is waiting.
+    Finished paragraphs are frozen into their own elements, so each flush only
+    re-sends the paragraph that is still being written rather than the whole turn.
+    """
+
+    def __init__(self, header_html: str, parent=None, fps: Optional[float] = None, flush_bytes: Optional[int] = None):
+        self.fps = fps or float(os.environ.get("RENDER_FPS", 8))
+        self.flush_bytes = flush_bytes or int(os.environ.get("RENDER_FLUSH_BYTES", 400))
+        self.renders = 0
+        self.bytes_sent = 0
+        super().__init__()
+        self._container = (parent or st).container()
+        self._send(self._container, header_html, unsafe_allow_html=True)
+        self._live = self._container.empty()
+        self._pending = ""
+        self._unflushed = 0
+        # Zero so the first token is shown immediately; later ones are throttled
+        self._last_flush = 0.0
+
+    def _send(self, element, body: str, **kwargs) -> None:
+        element.markdown(body, **kwargs)
+        self.renders += 1
+        self.bytes_sent += len(body.encode("utf-8"))
+
+    def write(self, text: str) -> None:
+        self.text += text
+        self._pending += text
+        self._unflushed += len(text)
+        if self._unflushed >= self.flush_bytes or time.monotonic() - self._last_flush >= 1 / self.fps:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._unflushed:
+            return
+        if "\n\n" in self._pending:
+            finished, self._pending = self._pending.rsplit("\n\n", 1)
+            self._send(self._live, finished)
+            self._live = self._container.empty()
+        if self._pending:
+            self._send(self._live, self._pending)
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    def stats(self) -> Dict[str, int]:
+        return {"renders": self.renders, "bytes_sent": self.bytes_sent, "chars": len(self.text)}
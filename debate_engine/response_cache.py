@@ -0,0 +1,186 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk
+
+# One streamed chunk, as plain JSON: the AIMessageChunk fields plus the generation info
+ChunkRecord = Dict[str, Any]
+
+
+def _message_key(message: BaseMessage) -> Dict[str, Any]:
+    # Message and run ids differ on every run, so only what the model actually sees is hashed
+    return {
+        "type": message.type,
+        "content": message.content,
+        "name": message.name,
+        "tool_calls": getattr(message, "tool_calls", None),
+        "tool_call_id": getattr(message, "tool_call_id", None),
+    }
+
+
+def cache_key(params: Dict[str, Any], messages: List[BaseMessage]) -> str:
+    """Hash of the model parameters (model, temperature, bound tools, stop, ...) and the exact messages."""
+    payload = {"params": params, "messages": [_message_key(message) for message in messages]}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def chunk_to_record(chunk: ChatGenerationChunk) -> ChunkRecord:
+    message = chunk.message
+    return {
+        "content": message.content,
+        "additional_kwargs": message.additional_kwargs,
+        "response_metadata": message.response_metadata,
+        "tool_call_chunks": getattr(message, "tool_call_chunks", []),
+        "usage_metadata": getattr(message, "usage_metadata", None),
+        "generation_info": chunk.generation_info,
+    }
+
+
+def message_to_record(message: AIMessage) -> ChunkRecord:
+    """A whole (non-streamed) response stored as a single chunk."""
+    return {
+        "content": message.content,
+        "additional_kwargs": message.additional_kwargs,
+        "response_metadata": message.response_metadata,
+        "tool_call_chunks": [
+            {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+            for i, call in enumerate(message.tool_calls)
+        ],
+        "usage_metadata": message.usage_metadata,
+        "generation_info": None,
+    }
+
+
+def record_to_chunk(record: ChunkRecord) -> ChatGenerationChunk:
+    fields = {k: v for k, v in record.items() if k != "generation_info" and v is not None}
+    return ChatGenerationChunk(message=AIMessageChunk(**fields), generation_info=record.get("generation_info"))
+
+
+class ResponseCache:
+    """Stored model responses, replayed chunk by chunk so callers still see a stream.
+
+    Responses are kept in an in-memory LRU of at most ``max_memory_bytes`` and,
+    when ``db_path`` is set, in a SQLite file of at most ``max_disk_bytes`` that
+    drops the least recently used responses first. Sizes are measured on the
+    JSON-encoded chunk list.
+    """
+
+    def __init__(self, max_memory_bytes: int = 32 * 2**20, db_path: Optional[str] = None,
+                 max_disk_bytes: int = 256 * 2**20):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[int, List[ChunkRecord]]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        if db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS response_cache ("
+                    "key TEXT PRIMARY KEY, model TEXT, size INTEGER NOT NULL, "
+                    "last_used REAL NOT NULL, chunks TEXT NOT NULL)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def get(self, key: str) -> Optional[List[ChunkRecord]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        chunks = self._load(key) if self.db_path else None
+        with self._lock:
+            if chunks is None:
+                self.misses += 1
+                return None
+            self._remember(key, chunks, len(json.dumps(chunks)))
+            self.hits += 1
+            return chunks
+
+    def set(self, key: str, chunks: List[ChunkRecord], model: str = "") -> None:
+        encoded = json.dumps(chunks)
+        with self._lock:
+            self._remember(key, chunks, len(encoded))
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?)",
+                        (key, model, len(encoded), time.time(), encoded),
+                    )
+                    self._evict_disk(conn)
+            except sqlite3.Error as e:
+                logging.warning(f"Could not persist response cache entry: {str(e)}")
+
+    def _remember(self, key: str, chunks: List[ChunkRecord], size: int) -> None:
+        previous = self._entries.pop(key, None)
+        if previous:
+            self._memory_bytes -= previous[0]
+        self._entries[key] = (size, chunks)
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes and len(self._entries) > 1:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._memory_bytes -= evicted
+
+    def _load(self, key: str) -> Optional[List[ChunkRecord]]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT chunks FROM response_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE response_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+                return json.loads(row[0])
+        except sqlite3.Error as e:
+            logging.warning(f"Could not read response cache: {str(e)}")
+            return None
+
+    def _evict_disk(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM response_cache ORDER BY last_used"):
+            if total <= self.max_disk_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM response_cache WHERE key = ?", stale)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def get_response_cache() -> Optional[ResponseCache]:
+    """The process-wide response cache, or None unless ``LLM_CACHE`` or ``LLM_CACHE_PATH`` turns it on."""
+    path = os.environ.get("LLM_CACHE_PATH")
+    if not path and os.environ.get("LLM_CACHE", "").lower() not in ("1", "true", "yes"):
+        return None
+    return ResponseCache(
+        max_memory_bytes=int(float(os.environ.get("LLM_CACHE_MEMORY_MB", 32)) * 2**20),
+        db_path=path,
+        max_disk_bytes=int(float(os.environ.get("LLM_CACHE_MAX_MB", 256)) * 2**20),
+    )
@@ -0,0 +1,344 @@
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import openai
+from langchain_core.language_models.chat_models import generate_from_stream
+from langchain_openai import ChatOpenAI
+
+from debate_engine.response_cache import (
+    cache_key,
+    chunk_to_record,
+    get_response_cache,
+    message_to_record,
+    record_to_chunk,
+)
+from debate_engine.transcript import count_tokens
+
+# Lower numbers are served first
+PRIORITY_IN_PROGRESS = 0
+PRIORITY_NEW = 1
+
+# Worth another attempt: 429s, connection errors and timeouts, and 5xx responses
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+_priority = contextvars.ContextVar("llm_priority", default=PRIORITY_NEW)
+
+
+@contextmanager
+def llm_priority(priority: int):
+    """Run the model calls made inside this block (and the tasks it starts) at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """Allows ``per_minute`` units a minute, refilled continuously, with a one-minute burst."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.available = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.available >= amount else (amount - self.available) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.available -= min(amount, self.capacity)
+
+
+def _jittered(attempt: int) -> float:
+    return min(2 ** attempt, 60) * (0.5 + random.random())
+
+
+class LLMScheduler:
+    """Process-wide admission control for model calls.
+
+    Calls wait in a priority queue and leave it only when both the request and the
+    token bucket can cover them, so concurrent sessions share one budget instead
+    of each discovering the provider's limit through its own 429s. A 429 pauses
+    every caller until the provider's ``retry-after`` has passed.
+
+    State is guarded by a thread lock rather than asyncio primitives because each
+    Streamlit session drives its debate on its own thread and event loop.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, max_retries: int = 5):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.rate_limited = 0
+        self.retried = 0
+        self.admitted = 0
+        self._queue = []
+        self._sequence = itertools.count()
+        self._paused_until = 0.0
+        self._waits = deque(maxlen=1000)
+        self._lock = threading.Lock()
+
+    def _enqueue(self, priority: Optional[int]) -> Tuple[int, int]:
+        ticket = (_priority.get() if priority is None else priority, next(self._sequence))
+        with self._lock:
+            heapq.heappush(self._queue, ticket)
+        return ticket
+
+    def _leave(self, ticket: Tuple[int, int]) -> None:
+        with self._lock:
+            if ticket in self._queue:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+
+    def _try_admit(self, ticket: Tuple[int, int], tokens: int, start: float) -> Tuple[Optional[float], float]:
+        """``(waited, 0)`` if ``ticket`` may start now, otherwise ``(None, seconds to wait)``."""
+        with self._lock:
+            now = time.monotonic()
+            if self._queue[0] != ticket:
+                return None, 0.05
+            if now < self._paused_until:
+                return None, self._paused_until - now
+            delay = max(self.requests.wait_time(1, now), self.tokens.wait_time(tokens, now))
+            if delay > 0:
+                return None, delay
+            heapq.heappop(self._queue)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self.admitted += 1
+            waited = now - start
+            self._waits.append(waited)
+            return waited, 0.0
+
+    async def acquire(self, tokens: int, priority: Optional[int] = None) -> float:
+        """Wait until this call may start; returns how long it waited."""
+        start = time.monotonic()
+        ticket = self._enqueue(priority)
+        try:
+            while True:
+                waited, delay = self._try_admit(ticket, tokens, start)
+                if waited is not None:
+                    return waited
+                await asyncio.sleep(min(delay, 0.25))
+        except BaseException:
+            self._leave(ticket)
+            raise
+
+    def acquire_blocking(self, tokens: int, priority: Optional[int] = None) -> float:
+        """``acquire`` for synchronous calls: blocks the calling thread instead of yielding to an event loop."""
+        start = time.monotonic()
+        ticket = self._enqueue(priority)
+        try:
+            while True:
+                waited, delay = self._try_admit(ticket, tokens, start)
+                if waited is not None:
+                    return waited
+                time.sleep(min(delay, 0.25))
+        except BaseException:
+            self._leave(ticket)
+            raise
+
+    def backoff(self, error: Exception, attempt: int) -> float:
+        """Pause everyone after a 429 and return the delay, honoring the provider's retry-after."""
+        retry_after = None
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+        delay = retry_after if retry_after is not None else _jittered(attempt)
+        with self._lock:
+            self.rate_limited += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        logging.warning(f"Rate limited by the model provider; pausing model calls for {delay:.1f}s")
+        return delay
+
+    def retry_delay(self, error: Exception, attempt: int) -> float:
+        """Delay before retrying one call after a connection error, timeout or 5xx; nobody else waits."""
+        delay = _jittered(attempt)
+        with self._lock:
+            self.retried += 1
+        logging.warning(f"Model call failed ({type(error).__name__}); retrying in {delay:.1f}s")
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            return {
+                "queue_depth": len(self._queue),
+                "admitted": self.admitted,
+                "rate_limited": self.rate_limited,
+                "retried": self.retried,
+                "avg_wait": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "p95_wait": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3) if waits else 0.0,
+            }
+
+
+@functools.lru_cache(maxsize=None)
+def get_scheduler() -> LLMScheduler:
+    return LLMScheduler(
+        requests_per_minute=float(os.environ.get("LLM_RPM", 500)),
+        tokens_per_minute=float(os.environ.get("LLM_TPM", 80000)),
+    )
+
+
+class ScheduledChatOpenAI(ChatOpenAI):
+    """ChatOpenAI whose calls, sync and async, are admitted by the shared ``LLMScheduler``.
+
+    The scheduler owns retries, so the client's own are off by default: a 429
+    pauses every caller until the provider's ``retry-after``, while a connection
+    error, timeout or 5xx only delays the call that hit it. A streamed call is
+    only retried if it failed before its first chunk.
+
+    When the response cache is on (``LLM_CACHE``/``LLM_CACHE_PATH``), a call whose
+    model, parameters and messages were seen before replays the stored chunks
+    without touching the provider or the rate budget.
+    """
+
+    max_retries: int = 0
+    scheduler: Optional[Any] = None
+
+    def _scheduler(self) -> LLMScheduler:
+        return self.scheduler or get_scheduler()
+
+    def _estimate_tokens(self, messages) -> int:
+        prompt = sum(count_tokens(str(message.content)) for message in messages)
+        return prompt + (self.max_tokens or 512)
+
+    def _cache_key(self, messages, stop, kwargs) -> str:
+        return cache_key(self._get_invocation_params(stop=stop, **kwargs), messages)
+
+    @staticmethod
+    def _retry_delay(scheduler: LLMScheduler, error: Exception, attempt: int, started: bool = False) -> float:
+        """Seconds to wait before the next attempt after ``error``; re-raises it if there is none.
+
+        After a 429 the wait happens in ``acquire``, since the scheduler pauses everyone.
+        """
+        if started or attempt == scheduler.max_retries:
+            raise error
+        if isinstance(error, openai.RateLimitError):
+            scheduler.backoff(error, attempt)
+            return 0.0
+        return scheduler.retry_delay(error, attempt)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator:
+        cache = get_response_cache()
+        key = self._cache_key(messages, stop, kwargs) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            for record in cached:
+                chunk = record_to_chunk(record)
+                if run_manager:
+                    await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                yield chunk
+            return
+
+        scheduler = self._scheduler()
+        estimate = self._estimate_tokens(messages)
+        for attempt in range(scheduler.max_retries + 1):
+            await scheduler.acquire(estimate)
+            started = False
+            records = []
+            try:
+                async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    started = True
+                    if cache:
+                        records.append(chunk_to_record(chunk))
+                    yield chunk
+                if cache:
+                    cache.set(key, records, self.model_name)
+                return
+            except RETRYABLE_ERRORS as e:
+                await asyncio.sleep(self._retry_delay(scheduler, e, attempt, started))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.streaming:
+            # Delegates to _astream, which is already scheduled and cached
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        cache = get_response_cache()
+        key = self._cache_key(messages, stop, kwargs) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return generate_from_stream(iter(record_to_chunk(record) for record in cached))
+
+        scheduler = self._scheduler()
+        estimate = self._estimate_tokens(messages)
+        for attempt in range(scheduler.max_retries + 1):
+            await scheduler.acquire(estimate)
+            try:
+                result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+                if cache:
+                    cache.set(key, [message_to_record(result.generations[0].message)], self.model_name)
+                return result
+            except RETRYABLE_ERRORS as e:
+                await asyncio.sleep(self._retry_delay(scheduler, e, attempt))
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator:
+        cache = get_response_cache()
+        key = self._cache_key(messages, stop, kwargs) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            for record in cached:
+                chunk = record_to_chunk(record)
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                yield chunk
+            return
+
+        scheduler = self._scheduler()
+        estimate = self._estimate_tokens(messages)
+        for attempt in range(scheduler.max_retries + 1):
+            scheduler.acquire_blocking(estimate)
+            started = False
+            records = []
+            try:
+                for chunk in super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    started = True
+                    if cache:
+                        records.append(chunk_to_record(chunk))
+                    yield chunk
+                if cache:
+                    cache.set(key, records, self.model_name)
+                return
+            except RETRYABLE_ERRORS as e:
+                time.sleep(self._retry_delay(scheduler, e, attempt, started))
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.streaming:
+            # Delegates to _stream, which is already scheduled and cached
+            return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        cache = get_response_cache()
+        key = self._cache_key(messages, stop, kwargs) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return generate_from_stream(iter(record_to_chunk(record) for record in cached))
+
+        scheduler = self._scheduler()
+        estimate = self._estimate_tokens(messages)
+        for attempt in range(scheduler.max_retries + 1):
+            scheduler.acquire_blocking(estimate)
+            try:
+                result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+                if cache:
+                    cache.set(key, [message_to_record(result.generations[0].message)], self.model_name)
+                return result
+            except RETRYABLE_ERRORS as e:
+                time.sleep(self._retry_delay(scheduler, e, attempt))
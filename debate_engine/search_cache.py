@@ -0,0 +1,124 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+SearchResults = List[Dict[str, str]]
+
+
+def normalize_query(search_term: str) -> str:
+    """Collapse case and whitespace so near-identical queries share a cache entry."""
+    return " ".join(search_term.lower().split())
+
+
+class SearchCache:
+    """LRU cache for search results, optionally backed by a SQLite file with a TTL.
+
+    Entries live in memory up to ``max_entries``; when ``db_path`` is set they are
+    also written to disk so they survive restarts and are shared between processes.
+    Entries older than ``ttl_seconds`` are treated as misses and evicted.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 24 * 3600, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, SearchResults]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS search_cache ("
+                    "query TEXT NOT NULL, num_results INTEGER NOT NULL, "
+                    "stored_at REAL NOT NULL, results TEXT NOT NULL, "
+                    "PRIMARY KEY (query, num_results))"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _expired(self, stored_at: float) -> bool:
+        return time.time() - stored_at > self.ttl_seconds
+
+    def get(self, search_term: str, num_results: int, record: bool = True) -> Optional[SearchResults]:
+        """The cached results, or None; ``record=False`` leaves the hit/miss counts alone."""
+        key = (normalize_query(search_term), num_results)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not self._expired(entry[0]):
+                self._entries.move_to_end(key)
+                self.hits += record
+                return entry[1]
+            self._entries.pop(key, None)
+
+        entry = self._load(key) if self.db_path else None
+        with self._lock:
+            if entry is None:
+                self.misses += record
+                return None
+            self._remember(key, entry)
+            self.hits += record
+            return entry[1]
+
+    def set(self, search_term: str, num_results: int, results: SearchResults) -> None:
+        key = (normalize_query(search_term), num_results)
+        entry = (time.time(), results)
+        with self._lock:
+            self._remember(key, entry)
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?)",
+                        (key[0], key[1], entry[0], json.dumps(results)),
+                    )
+            except sqlite3.Error as e:
+                logging.warning(f"Could not persist search cache entry: {str(e)}")
+
+    def _remember(self, key: Tuple[str, int], entry: Tuple[float, SearchResults]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: Tuple[str, int]) -> Optional[Tuple[float, SearchResults]]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT stored_at, results FROM search_cache WHERE query = ? AND num_results = ?", key
+                ).fetchone()
+                if row is None:
+                    return None
+                if self._expired(row[0]):
+                    conn.execute("DELETE FROM search_cache WHERE query = ? AND num_results = ?", key)
+                    return None
+                return row[0], json.loads(row[1])
+        except sqlite3.Error as e:
+            logging.warning(f"Could not read search cache: {str(e)}")
+            return None
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from memory and disk, returning how many disk rows were removed."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for key in [k for k, (stored_at, _) in self._entries.items() if stored_at < cutoff]:
+                del self._entries[key]
+        if not self.db_path:
+            return 0
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM search_cache WHERE stored_at < ?", (cutoff,)).rowcount
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,154 @@
+import asyncio
+import atexit
+import functools
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import httplib2
+import httpx
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+
+from debate_engine.clients import PerLoopTransport
+from debate_engine.search_cache import SearchResults
+
+DEFAULT_ENDPOINT = "https://customsearch.googleapis.com"
+
+
+@functools.lru_cache(maxsize=None)
+def discovery_document() -> dict:
+    """The bundled Custom Search discovery document, parsed once per process."""
+    return json.loads(discovery_cache.get_static_doc("customsearch", "v1"))
+
+
+class SearchBackend:
+    """Anything that can answer a google_search tool call.
+
+    Swap in a different implementation with ``set_search_backend`` to run the
+    agents against a stub server or canned results.
+    """
+
+    def search(self, search_term: str, num_results: int) -> SearchResults:
+        raise NotImplementedError
+
+    async def asearch(self, search_term: str, num_results: int) -> SearchResults:
+        """Async ``search``; backends without a native one run ``search`` on a worker thread."""
+        return await asyncio.to_thread(self.search, search_term, num_results)
+
+    def close(self) -> None:
+        """Release the backend's connections; backends that hold none need not override this."""
+
+
+class GoogleSearchBackend(SearchBackend):
+    """Custom Search client built once per worker thread from the bundled discovery document.
+
+    ``httplib2.Http`` is not thread-safe, so each thread gets its own transport and
+    service object; both are reused for every later call on that thread, keeping
+    the connection to the API alive between searches. ``api_endpoint`` points the
+    client at a different host, e.g. a local stub search server.
+
+    ``asearch`` calls the same REST endpoint with a shared httpx client instead,
+    so the agents' concurrent tool calls do not each tie up a thread. ``close``
+    shuts every thread's and every event loop's connections.
+    """
+
+    def __init__(self, api_key: str, cse_id: str, api_endpoint: Optional[str] = None, timeout: float = 10):
+        self.api_key = api_key
+        self.cse_id = cse_id
+        self.api_endpoint = api_endpoint
+        self.timeout = timeout
+        # build() would otherwise re-read and re-parse the document on every call
+        self._document = discovery_document()
+        self._local = threading.local()
+        self._https: List[httplib2.Http] = []
+        self._https_lock = threading.Lock()
+        self._transport = PerLoopTransport(httpx.AsyncHTTPTransport)
+        self._async_client = httpx.AsyncClient(
+            base_url=(api_endpoint or DEFAULT_ENDPOINT).rstrip("/"), transport=self._transport, timeout=timeout
+        )
+
+    def _service(self):
+        service = getattr(self._local, "service", None)
+        if service is None:
+            client_options = {"api_endpoint": self.api_endpoint} if self.api_endpoint else None
+            http = httplib2.Http(timeout=self.timeout)
+            with self._https_lock:
+                self._https.append(http)
+            service = build_from_document(
+                self._document,
+                http=http,
+                developerKey=self.api_key,
+                client_options=client_options,
+            )
+            self._local.service = service
+        return service
+
+    def search(self, search_term: str, num_results: int) -> SearchResults:
+        res = self._service().cse().list(q=search_term, cx=self.cse_id, num=num_results).execute()
+        items = res.get("items", [])
+        return [{"title": item["title"], "snippet": item["snippet"], "link": item["link"]} for item in items]
+
+    async def asearch(self, search_term: str, num_results: int) -> SearchResults:
+        response = await self._async_client.get(
+            "/customsearch/v1", params={"key": self.api_key, "cx": self.cse_id, "q": search_term, "num": num_results}
+        )
+        response.raise_for_status()
+        items = response.json().get("items", [])
+        return [{"title": item["title"], "snippet": item["snippet"], "link": item["link"]} for item in items]
+
+    def close(self) -> None:
+        with self._https_lock:
+            https, self._https = self._https, []
+        for http in https:
+            http.close()
+        self._local = threading.local()
+        self._transport.close()
+
+
+_backends: "OrderedDict[Tuple[str, str, Optional[str]], SearchBackend]" = OrderedDict()
+_backend_override: Optional[SearchBackend] = None
+_lock = threading.Lock()
+
+
+def set_search_backend(backend: Optional[SearchBackend]) -> None:
+    """Route every search in this process through ``backend`` (``None`` restores Google)."""
+    global _backend_override
+    _backend_override = backend
+
+
+def get_search_backend(api_key: str, cse_id: str) -> SearchBackend:
+    """Return the process-wide backend for these credentials, creating it on first use.
+
+    Set ``SEARCH_API_ENDPOINT`` to send Custom Search requests to another host. The
+    ``SEARCH_BACKEND_POOL_SIZE`` most recently used backends are kept; older ones
+    are closed.
+    """
+    if _backend_override is not None:
+        return _backend_override
+    key = (api_key, cse_id, os.environ.get("SEARCH_API_ENDPOINT"))
+    evicted = []
+    with _lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = _backends[key] = GoogleSearchBackend(api_key, cse_id, api_endpoint=key[2])
+        _backends.move_to_end(key)
+        while len(_backends) > int(os.environ.get("SEARCH_BACKEND_POOL_SIZE", 64)):
+            evicted.append(_backends.popitem(last=False)[1])
+    for old in evicted:
+        old.close()
+    return backend
+
+
+def close_search_backends() -> None:
+    """Close and forget every cached backend; runs at process exit."""
+    with _lock:
+        backends = list(_backends.values())
+        _backends.clear()
+    for backend in backends:
+        backend.close()
+
+
+atexit.register(close_search_backends)
@@ -0,0 +1,45 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+_DONE = object()
+
+
+async def stream_agent_tokens(graph, inputs, config, maxsize: int = 64) -> AsyncIterator[str]:
+    """Yield the chat-model tokens of an agent run as they arrive.
+
+    ``astream_events`` runs in its own task and feeds a bounded queue that the
+    caller drains on the same event loop, so a slow consumer (the UI) applies
+    backpressure instead of buffering the whole answer, and no token ever has to
+    re-enter the loop. Errors from the agent are re-raised to the caller.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    error: Optional[BaseException] = None
+
+    async def produce():
+        nonlocal error
+        try:
+            async for event in graph.astream_events(inputs, config=config, version="v2"):
+                if event["event"] == "on_chat_model_stream":
+                    content = event["data"]["chunk"].content
+                    if content:
+                        await queue.put(content)
+        except Exception as e:
+            error = e
+        await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            token = await queue.get()
+            if token is _DONE:
+                break
+            yield token
+        if error is not None:
+            raise error
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,147 @@
+import asyncio
+import functools
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import StructuredTool
+
+from debate_engine.evidence import get_evidence_store
+from debate_engine.search_cache import SearchCache, SearchResults
+from debate_engine.search_client import get_search_backend
+
+
+@functools.lru_cache(maxsize=None)
+def get_search_cache() -> SearchCache:
+    # Shared by every debate in this process; set SEARCH_CACHE_PATH to also persist results to SQLite
+    return SearchCache(
+        max_entries=int(os.environ.get("SEARCH_CACHE_SIZE", 512)),
+        ttl_seconds=float(os.environ.get("SEARCH_CACHE_TTL", 24 * 3600)),
+        db_path=os.environ.get("SEARCH_CACHE_PATH"),
+    )
+
+
+def prefetch_search(api_key: str, cse_id: str, search_term: str, num_results: int = 3) -> SearchResults:
+    """A speculative search through the cache; its cache reads are not counted, so the hit rate is the agents' own."""
+    cache = get_search_cache()
+    cached = cache.get(search_term, num_results, record=False)
+    if cached is not None:
+        return cached
+
+    results = get_search_backend(api_key, cse_id).search(search_term, num_results)
+    cache.set(search_term, num_results, results)
+    return results
+
+
+def search_concurrency() -> int:
+    """Searches one debate may have in flight at once, across its agents' parallel tool calls."""
+    return int(os.environ.get("SEARCH_CONCURRENCY", 3))
+
+
+def _configurable(config) -> Dict:
+    # Credentials arrive through the run config so one compiled agent can serve every caller; their "__"
+    # keys keep langgraph from copying them into checkpoint metadata
+    configurable = (config or {}).get("configurable", {})
+    if not configurable.get("__google_api_key") or not configurable.get("__google_cse_id"):
+        raise ValueError("Google API credentials not configured in secrets")
+    return configurable
+
+
+def _record(configurable, search_term: str, start: float, results: SearchResults, source: str) -> None:
+    metrics = configurable.get("metrics")
+    if metrics:
+        metrics.record("search", search_term, start, time.perf_counter(), source=source, results=len(results))
+
+
+def search_google(search_term: str, num_results: int = 3, config: RunnableConfig = None) -> List[Dict[str, str]]:
+    """Search Google for the given query."""
+    configurable = _configurable(config)
+    start = time.perf_counter()
+    results, source = _search(configurable, search_term, num_results)
+    _record(configurable, search_term, start, results, source)
+    return results
+
+
+async def asearch_google(search_term: str, num_results: int = 3, config: RunnableConfig = None) -> List[Dict[str, str]]:
+    """Search Google for the given query."""
+    configurable = _configurable(config)
+    start = time.perf_counter()
+    # The agent runs all tool calls of a step at once; the debate's slots bound how many searches that means
+    slots = configurable.get("search_slots")
+    if slots:
+        async with slots:
+            results, source = await _asearch(configurable, search_term, num_results)
+    else:
+        results, source = await _asearch(configurable, search_term, num_results)
+    _record(configurable, search_term, start, results, source)
+    return results
+
+
+def _local(configurable, search_term: str, num_results: int,
+           pooled: Optional[SearchResults]) -> Optional[Tuple[SearchResults, str]]:
+    """A prefetched result (``pooled``) or stored evidence good enough to answer the search without Google."""
+    store = get_evidence_store()
+    if pooled is not None:
+        if store:
+            store.add(pooled, search_term, configurable.get("topic"))
+        return pooled, "prefetch"
+
+    # Evidence gathered by earlier debates, if it covers this query well enough
+    stored = store.retrieve(search_term, num_results) if store else None
+    if stored is not None:
+        return stored, "store"
+    return None
+
+
+def _search(configurable, search_term: str, num_results: int) -> Tuple[SearchResults, str]:
+    cache = get_search_cache()
+    cached = cache.get(search_term, num_results)
+    if cached is not None:
+        return cached, "cache"
+
+    # Searches started speculatively while the other side was speaking
+    pool = configurable.get("evidence_pool")
+    local = _local(configurable, search_term, num_results, pool.lookup(search_term, num_results) if pool else None)
+    if local:
+        return local
+
+    # The cache was already checked above
+    backend = get_search_backend(configurable["__google_api_key"], configurable["__google_cse_id"])
+    results = backend.search(search_term, num_results)
+    cache.set(search_term, num_results, results)
+    _file(configurable, search_term, results)
+    return results, "live"
+
+
+async def _asearch(configurable, search_term: str, num_results: int) -> Tuple[SearchResults, str]:
+    cache = get_search_cache()
+    cached = cache.get(search_term, num_results)
+    if cached is not None:
+        return cached, "cache"
+
+    # Waiting for an in-flight prefetch blocks, so it happens off the event loop
+    pool = configurable.get("evidence_pool")
+    pooled = await asyncio.to_thread(pool.lookup, search_term, num_results) if pool else None
+    local = _local(configurable, search_term, num_results, pooled)
+    if local:
+        return local
+
+    backend = get_search_backend(configurable["__google_api_key"], configurable["__google_cse_id"])
+    results = await backend.asearch(search_term, num_results)
+    cache.set(search_term, num_results, results)
+    _file(configurable, search_term, results)
+    return results, "live"
+
+
+def _file(configurable, search_term: str, results: SearchResults) -> None:
+    store = get_evidence_store()
+    if store:
+        store.add(results, search_term, configurable.get("topic"))
+
+
+google_search = StructuredTool.from_function(
+    func=search_google, coroutine=asearch_google, name="google_search", description="Search Google for the given query."
+)
+
+tools = [google_search]
@@ -0,0 +1,123 @@
+import functools
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+URL_PATTERN = re.compile(r"https?://[^\s)\]>\"'<]+")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@functools.lru_cache(maxsize=None)
+def token_encoding():
+    """The cl100k_base encoding, or None; loaded on first use because a cold cache downloads its BPE file."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # tiktoken missing or its encoding file could not be fetched
+        return None
+
+
+def count_tokens(text: str) -> int:
+    encoding = token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text) // 4 + 1
+
+
+@dataclass
+class Turn:
+    """One finished argument: plain text only, never the HTML header shown in the UI."""
+
+    role: str
+    round: int
+    text: str
+    citations: List[str] = field(default_factory=list)
+    prompt_tokens: int = 0
+    summary: Optional[str] = None
+    # Share of content words no earlier turn used (see debate_engine.convergence)
+    novelty: Optional[float] = None
+
+
+def make_turn(role: str, round_num: int, text: str, prompt_tokens: int = 0, novelty: Optional[float] = None) -> Turn:
+    citations = list(dict.fromkeys(url.rstrip(".,;:") for url in URL_PATTERN.findall(text)))
+    return Turn(
+        role=role, round=round_num, text=text.strip(), citations=citations, prompt_tokens=prompt_tokens, novelty=novelty
+    )
+
+
+def extractive_summary(turn: Turn, max_words: int = 50) -> str:
+    """Cheap summary: the opening sentences of the turn plus its sources, no model call."""
+    plain = URL_PATTERN.sub("", turn.text)
+    words: List[str] = []
+    for sentence in SENTENCE_END.split(" ".join(plain.split())):
+        words.extend(sentence.split())
+        if len(words) >= max_words:
+            break
+    summary = " ".join(words[:max_words])
+    if turn.citations:
+        summary += f" (sources: {', '.join(turn.citations)})"
+    return summary
+
+
+def format_turn(turn: Turn) -> str:
+    return f"{turn.role} (round {turn.round}):\n{turn.text}"
+
+
+def transcript_text(topic: str, turns: List[Turn]) -> str:
+    """The whole debate as plain text, e.g. for the jury."""
+    return "\n\n".join([f"The debate topic is: {topic}"] + [format_turn(turn) for turn in turns])
+
+
+class ContextBuilder:
+    """Packs the debate so far into a token budget for the next agent prompt.
+
+    The newest turns go in verbatim, newest first, until ``verbatim_share`` of the
+    budget is used; older turns are replaced by their (cached) summaries for as long
+    as those still fit. Prompt size therefore stays flat as rounds are added.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: Optional[int] = None,
+        verbatim_share: float = 0.7,
+        summarize: Callable[[Turn], str] = extractive_summary,
+    ):
+        self.budget_tokens = budget_tokens or int(os.environ.get("CONTEXT_TOKEN_BUDGET", 1500))
+        self.verbatim_share = verbatim_share
+        self.summarize = summarize
+
+    def build(self, turns: List[Turn]) -> Tuple[str, int]:
+        if not turns:
+            return "No arguments have been made yet.", 0
+
+        used = 0
+        recent: List[str] = []
+        index = len(turns)
+        while index > 0:
+            block = format_turn(turns[index - 1])
+            cost = count_tokens(block)
+            if used + cost > self.budget_tokens * self.verbatim_share:
+                break
+            recent.insert(0, block)
+            used += cost
+            index -= 1
+
+        summaries: List[str] = []
+        for turn in reversed(turns[:index]):
+            if turn.summary is None:
+                turn.summary = self.summarize(turn)
+            line = f"- {turn.role}, round {turn.round}: {turn.summary}"
+            cost = count_tokens(line)
+            if used + cost > self.budget_tokens:
+                break
+            summaries.insert(0, line)
+            used += cost
+
+        parts = []
+        if summaries:
+            parts.append("Earlier arguments (summarized):\n" + "\n".join(summaries))
+        if recent:
+            parts.append("Most recent arguments:\n\n" + "\n\n".join(recent))
+        return "\n\n".join(parts), used
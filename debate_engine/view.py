@@ -0,0 +1,47 @@
+from typing import Dict, List
+
+from debate_engine.transcript import Turn
+
+
+class TurnWriter:
+    """Collects the text of one streamed turn; UIs subclass it to show tokens as they arrive."""
+
+    def __init__(self):
+        self.text = ""
+
+    def write(self, text: str) -> None:
+        self.text += text
+
+    def flush(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {"chars": len(self.text)}
+
+
+class DebateView:
+    """Presentation hooks called by the debate nodes.
+
+    The base class shows nothing, which is what headless runs want; the Streamlit
+    page passes its own subclass through ``config["configurable"]["view"]``.
+    """
+
+    def start_turn(self, name: str, round_num: int) -> TurnWriter:
+        return TurnWriter()
+
+    def start_openings(self, names: List[str]) -> List[TurnWriter]:
+        """Writers for opening statements that stream at the same time; UIs can lay them out side by side."""
+        return [self.start_turn(name, 1) for name in names]
+
+    def replay_turn(self, turn: Turn) -> None:
+        pass
+
+    def ended_early(self, reason: str, turns_saved: int) -> None:
+        """The debate goes to the jury before its last round (adaptive length)."""
+        pass
+
+    def start_jury(self) -> None:
+        pass
+
+    def jury_section(self, section: Dict[str, str]) -> None:
+        pass
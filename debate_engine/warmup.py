@@ -0,0 +1,76 @@
+"""Load the debate engine's heavy dependencies ahead of the first debate.
+
+    python -m debate_engine.warmup
+
+The debate page only imports these when a debate starts; ``start_prewarm`` loads
+them on a background thread as soon as the app is first opened, so the first
+"Start Debate" of a fresh container does not pay for them.
+"""
+import functools
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Dict
+
+# Roughly in order of import cost; everything a debate needs that the page itself does not
+HEAVY_MODULES = (
+    "langchain_openai",
+    "langgraph.graph",
+    "langgraph.prebuilt",
+    "googleapiclient.discovery",
+    "debate_engine.scheduler",
+    "debate_engine.graph",
+    "debate_engine.checkpoints",
+    "altair",
+)
+
+
+def prewarm() -> Dict[str, float]:
+    """Import the heavy modules, compile the debate graph, parse the discovery document and load the tokenizer.
+
+    Returns the seconds each step took; steps that were already done take ~0.
+    """
+    timings = {}
+    for name in HEAVY_MODULES:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        timings[name] = round(time.perf_counter() - start, 3)
+
+    from debate_engine.graph import get_debate_workflow
+    from debate_engine.search_client import discovery_document
+    from debate_engine.transcript import token_encoding
+
+    start = time.perf_counter()
+    get_debate_workflow()
+    timings["workflow"] = round(time.perf_counter() - start, 3)
+    start = time.perf_counter()
+    discovery_document()
+    timings["discovery_document"] = round(time.perf_counter() - start, 3)
+    start = time.perf_counter()
+    token_encoding()
+    timings["token_encoding"] = round(time.perf_counter() - start, 3)
+    return timings
+
+
+def _prewarm_in_background() -> None:
+    try:
+        timings = prewarm()
+        logging.info(f"Prewarmed debate engine in {sum(timings.values()):.2f}s: {timings}")
+    except Exception as e:
+        logging.warning(f"Prewarming the debate engine failed: {str(e)}")
+
+
+@functools.lru_cache(maxsize=None)
+def start_prewarm() -> threading.Thread:
+    """Start ``prewarm`` on a daemon thread (once per process); ``DEBATE_PREWARM=0`` turns it off."""
+    thread = threading.Thread(target=_prewarm_in_background, name="debate-prewarm", daemon=True)
+    if os.environ.get("DEBATE_PREWARM", "1").lower() not in ("0", "false", "no"):
+        thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    for step, seconds in prewarm().items():
+        print(f"{step:<28} {seconds:6.3f}s")
@@ -1,26 +1,22 @@
-import asyncio
-import logging
 import os
-import traceback
-import tracemalloc
-from typing import Dict, List, Optional, TypedDict
+import uuid
 
-import nest_asyncio
 import streamlit as st
-from googleapiclient.discovery import build
-from langchain_core.runnables import RunnableConfig
-from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
-from langgraph.graph import END, StateGraph
-from langgraph.prebuilt import create_react_agent
-from langsmith import traceable
-from pathlib import Path
-import base64
 
-nest_asyncio.apply()
-
-logging.basicConfig(level=logging.INFO)
-tracemalloc.start()
+from debate_engine.assets import sidebar_image
+from debate_engine.clients import get_chat_model
+from debate_engine.jobs import follow, get_job_manager
+from debate_engine.jury import make_jury_panel
+from debate_engine.logs import configure_logging
+from debate_engine.metrics import DebateMetrics
+from debate_engine.prompts import DEBATE_TOPICS
+from debate_engine.rendering import StreamRenderer
+from debate_engine.view import DebateView
+from debate_engine.warmup import start_prewarm
+
+configure_logging()
+# LangChain, LangGraph and the Google client are only imported once a debate starts; load them in the background now
+start_prewarm()
 
 # Set page config
 st.set_page_config(
@@ -29,19 +25,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Get the correct path by going up one directory level from pages
-assets_dir = Path(__file__).parent.parent / "assets"
-gif_path = assets_dir / "animate-debate.gif"
-
 try:
-    # Read and display the GIF
-    with open(gif_path, "rb") as file_:
-        contents = file_.read()
-        data_url = base64.b64encode(contents).decode("utf-8")
-        st.sidebar.markdown(
-            f'<img src="data:image/gif;base64,{data_url}" alt="V3 AI animated logo">',
-            unsafe_allow_html=True,
-        )
+    sidebar_image("animate-debate.gif", "V3 AI animated logo")
 except Exception as e:
     st.error(f"Could not load animated logo: {str(e)}")
 
@@ -61,73 +46,12 @@ if not st.session_state.get("openai_api_key"):
 # Set up page
 st.sidebar.title("Topic Configuration")
 
-@tool
-def google_search(search_term: str, num_results: int = 3) -> List[Dict[str, str]]:
-    """Search Google for the given query."""
-    if "GOOGLE_API_KEY" not in st.secrets or "GOOGLE_CSE_ID" not in st.secrets:
-        raise ValueError("Google API credentials not configured in secrets")
-    
-    service = build("customsearch", "v1", developerKey=st.secrets["GOOGLE_API_KEY"])
-    res = service.cse().list(q=search_term, cx=st.secrets["GOOGLE_CSE_ID"], num=num_results).execute()
-    items = res.get("items", [])
-    return [{"title": item["title"], "snippet": item["snippet"], "link": item["link"]} for item in items]
-
-# Set up tools
-tools = [google_search]
-
-# Initialize the language model with session state API key
-llm = ChatOpenAI(
-    api_key=st.session_state.openai_api_key,
-    model="gpt-4",
-    temperature=0.3,
-    streaming=True
-)
-
-
-class GraphState(TypedDict):
-    history: str
-    current_speaker: str
-    turn_count: int
-    result: Optional[str]
-
-
-DEBATE_TOPICS = [
-    "Is Python truly the best programming language for data science?",
-    "Should we embrace or fear the rise of AutoML?",
-    "Are neural networks overhyped compared to traditional machine learning methods?",
-    "Is 'data scientist' becoming an obsolete job title?",
-    "Should all data scientists be required to learn how to deploy models in production?",
-    "Is the pursuit of 100% accuracy in machine learning models a fool's errand?",
-    "Are Jupyter notebooks a blessing or a curse for data science workflows?",
-    "Should data scientists prioritize learning cloud platforms over local development?",
-    "Is the 'big data' hype over? Should we focus more on 'smart data'?",
-    "Are GPT models making traditional NLP techniques obsolete?",
-    "Should data ethics be a mandatory course in all data science programs?",
-    "Is the role of domain expertise overrated in data science projects?",
-    "Are we overusing deep learning for problems that simpler models could solve?",
-    "Should all companies have a 'data-first' approach to decision making?",
-    "Is the data science field becoming oversaturated?",
-    "Are we relying too heavily on pre-trained models and transfer learning?",
-    "Should data scientists focus more on interpretability than performance?",
-    "Is the hype around 'real-time' analytics justified?",
-    "Are we neglecting the importance of data quality in favor of sophisticated algorithms?",
-    "Should data scientists be more involved in data collection and experimental design?",
-]
-
-
-async def async_stream_response(generator):
-    async for chunk in generator:
-        yield chunk
-
-
-def sync_stream_response(generator):
-    loop = asyncio.get_event_loop()
-    async_gen = generator()
-    while True:
-        try:
-            yield loop.run_until_complete(async_gen.__anext__())
-        except StopAsyncIteration:
-            break
+def get_secret(name):
+    try:
+        return st.secrets.get(name)
+    except FileNotFoundError:
+        # No secrets.toml; google_search reports the missing credentials when it is called
+        return None
 
 
 def create_agent_header(name, emoji, round_num):
@@ -164,59 +88,6 @@ def get_round_description(round_num):
     return descriptions[round_num - 1]
 
 
-@traceable
-async def agent_node(state, name, config):
-    prompt = champion_prompt if name == "Champion" else challenger_prompt
-    graph = create_react_agent(llm, tools=tools, state_modifier=prompt)
-
-    inputs = {
-        "messages": [
-            (
-                "user",
-                f"Topic: {debate_topic}\n\nFull conversation history:\n{state['history']}\n\nProvide your argument for round {state['turn_count'] // 2 + 1}, {'supporting' if name == 'Champion' else 'challenging'} the topic. Use the Google search tool to find supporting evidence.",
-            )
-        ]
-    }
-
-    emoji = "🛡️" if name == "Champion" else "⚔️"
-    response_placeholder = st.empty()
-    round_num = state["turn_count"] // 2 + 1
-    full_response = create_agent_header(name, emoji, round_num)
-
-    async def stream_response():
-        nonlocal full_response
-        try:
-            async for event in graph.astream_events(inputs, config=config, version="v1"):
-                kind = event["event"]
-                if kind == "on_chat_model_stream":
-                    content = event["data"]["chunk"].content
-                    if content:
-                        full_response += content
-                        response_placeholder.markdown(full_response, unsafe_allow_html=True)
-                        yield content
-        except Exception as e:
-            logging.error(f"Error in {name}: {str(e)}")
-            error_message = f"Error: {str(e)}. Unable to use Google Search. Providing argument without search: "
-            full_response += error_message
-            response_placeholder.markdown(full_response, unsafe_allow_html=True)
-            yield error_message
-            yield llm.invoke(inputs["messages"][0][1], config=config).content
-
-    response_chunks = list(sync_stream_response(stream_response))
-    response = "".join(response_chunks)
-    return full_response
-
-
-@traceable
-async def champion_node(state, config):
-    return await agent_node(state, "Champion", config)
-
-
-@traceable
-async def challenger_node(state, config):
-    return await agent_node(state, "Challenger", config)
-
-
 def create_jury_header():
     return f"""
     <div style="
@@ -274,119 +145,166 @@ def format_jury_section(title, content, color):
     """
 
 
-@traceable
-def jury_node(state, prompt, name, config):
-    logging.info("Starting Jury deliberation")
-    full_prompt = prompt.format(history=state["history"])
-    response = llm.invoke(full_prompt, config=config).content
-
-    # Parse the response and format each section
-    sections = response.split("\n\n")
-    formatted_response = []
-
-    for section in sections:
-        if ":" in section:
-            title, content = section.split(":", 1)
-            formatted_response.append({"title": title.strip(), "content": content.strip()})
-
-    logging.info("Finished Jury deliberation")
-    return {
-        "history": state["history"],
-        "current_speaker": state["current_speaker"],
-        "turn_count": state["turn_count"],
-        "result": formatted_response,
-    }
-
-
-champion_prompt = """You are the Champion in a four-round debate, enthusiastically supporting the given topic. Structure your arguments clearly and provide evidence-based points.
-
-For each round, perform these steps;
-1. Present 2-3 main arguments supporting your position.
-2. Use the Google Search tool to find current information or facts to support your points.
-3. Cite your sources with full URLs.
-4. Respond to the Challenger's previous points if applicable.
-
-Debate structure:
-- Round 1: Introduce your main arguments.
-- Round 2: Reinforce your position and counter the opposing arguments.
-- Round 3: Summarize your key points and provide a strong closing argument.
-
-Output Structure:
-- Provide a clear and concise argument for each round.
-- Do not work out the steps in your responses, simply perform the tasks.
-- You should structure your responses in a way that is easy to follow and engaging.
-
-Keep your tone confident and positive. Avoid concluding statements until the final round. Ensure a natural flow of debate by building on previous points and responding to the Challenger's arguments. BE CONCISE AND BRIEF.
-
-Your response will be automatically formatted with a header. Do not add any additional formatting."""
-
-challenger_prompt = """You are the Challenger in a four-round debate, critically examining and arguing against the given topic. Structure your arguments clearly and provide evidence-based points.
-
-For each round, perform these steps.
-
-1. Present 2-3 main arguments against the proposed position.
-2. Use the Google Search tool to find current information or facts to support your points.
-3. Cite your sources with full URLs.
-4. Respond to the Champion's previous points if applicable.
+def render_jury_section(section):
+    if "🏆" in section["title"]:
+        color = "#FFD700"  # Gold
+    elif "🎭" in section["title"]:
+        color = "#4CAF50"  # Green
+    elif "🌟" in section["title"]:
+        color = "#F44336"  # Red
+    elif "💡" in section["title"]:
+        color = "#9C27B0"  # Purple
+    else:
+        color = "#607D8B"  # Blue Grey
+
+    formatted_html = format_jury_section(section["title"], section["content"], color)
+    st.markdown(formatted_html, unsafe_allow_html=True)
+
+
+def render_waterfall(metrics):
+    import altair as alt
+
+    # One bar per turn, jury call and search, positioned by when it started in this run
+    rows = [
+        {
+            "name": span.name,
+            "kind": span.kind,
+            "start": span.start,
+            "end": span.start + span.duration,
+            "seconds": span.duration,
+            "ttft": span.attrs.get("ttft"),
+            "tokens/s": span.attrs.get("tokens_per_second"),
+            "source": span.attrs.get("source"),
+        }
+        for span in metrics.spans
+    ]
+    chart = (
+        alt.Chart(alt.Data(values=rows))
+        .mark_bar()
+        .encode(
+            x=alt.X("start:Q", title="Seconds since start"),
+            x2="end:Q",
+            y=alt.Y("name:N", sort=None, title=None),
+            color=alt.Color("kind:N", title=None),
+            tooltip=["name:N", "kind:N", "seconds:Q", "ttft:Q", "tokens/s:Q", "source:N"],
+        )
+    )
+    st.altair_chart(chart, use_container_width=True)
+    st.caption(f"Totals: {metrics.summary()}")
 
-Debate structure:
-- Round 1: Introduce your main arguments.
-- Round 2: Reinforce your position and counter the opposing arguments.
-- Round 3: Summarize your key points and provide a strong closing argument.
 
-Output Structure:
-- Provide a clear and concise argument for each round.
-- Do not work out the steps in your responses, simply perform the tasks.
-- You should structure your responses in a way that is easy to follow and engaging.
+class StreamlitDebateView(DebateView):
+    """Draws the debate nodes' output on this page."""
 
-Maintain a skeptical and analytical tone. Avoid concluding statements until the final round. Ensure a natural flow of debate by building on previous points and responding to the Champion's arguments. BE CONCISE AND BRIEF.
+    def start_turn(self, name, round_num):
+        emoji = "🛡️" if name == "Champion" else "⚔️"
+        return StreamRenderer(create_agent_header(name, emoji, round_num))
 
-Your response will be automatically formatted with a header. Do not add any additional formatting."""
+    def start_openings(self, names):
+        # Both opening statements stream at once, side by side
+        columns = st.columns(len(names))
+        return [
+            StreamRenderer(create_agent_header(name, "🛡️" if name == "Champion" else "⚔️", 1), parent=column)
+            for name, column in zip(names, columns)
+        ]
 
-jury_prompt = """As an impartial AI judge, carefully analyze the debate between the Champion and the Challenger. Evaluate the arguments presented by both sides based on the following criteria:
+    def replay_turn(self, turn):
+        # Redraw a turn restored from a checkpoint without calling the model again
+        emoji = "🛡️" if turn.role == "Champion" else "⚔️"
+        st.markdown(create_agent_header(turn.role, emoji, turn.round), unsafe_allow_html=True)
+        st.markdown(turn.text)
 
-1. Strength of arguments
-2. Use of evidence and sources
-3. Rebuttal effectiveness
-4. Overall persuasiveness
+    def ended_early(self, reason, turns_saved):
+        why = "a side conceded" if reason == "concession" else "the arguments stopped bringing anything new"
+        st.info(f"Calling the jury early because {why} ({turns_saved} turns saved).")
 
-Summarize the key points from both sides and determine a winner. No ties are allowed.
+    def start_jury(self):
+        st.markdown(create_jury_header(), unsafe_allow_html=True)
 
-Structure your response as follows:
+    def jury_section(self, section):
+        render_jury_section(section)
 
-🏆 Winner:
-[Name of winner]
 
-🎭 Debate Summary:
-[Brief recap of the main arguments from both sides]
+# Add a radio button for users to choose between predefined topics or custom topic
+topic_choice = st.sidebar.radio("Choose your topic:", ["Select from examples", "Enter custom topic"])
 
+if topic_choice == "Select from examples":
+    debate_topic = st.selectbox("Choose a topic to explore:", DEBATE_TOPICS)
+else:
+    debate_topic = st.text_input("Enter your topic:")
 
-🌟 Winning Factors:
-[Explain the key reasons why the winner was chosen]
+parallel_openings = st.sidebar.checkbox(
+    "Parallel opening statements", value=False, help="Both sides write their opening statements at the same time"
+)
 
-💡 Final Thoughts:
-[Provide a concluding statement on the debate's overall quality and any interesting insights gained]
+adaptive_length = st.sidebar.checkbox(
+    "Adaptive debate length", value=False,
+    help="Call the jury before the last round once the arguments stop bringing anything new or a side concedes",
+)
 
-The sections must be formatted exactly like this;
+# Operators running with DEBATE_ADMIN=1 can profile a single debate without setting MEMORY_PROFILE for everyone
+memory_profile = bool(os.environ.get("DEBATE_ADMIN")) and st.sidebar.checkbox(
+    "Memory profiling", value=False, help="Log allocation growth between turns and sample RSS while this debate runs"
+)
 
-'emoji' 'section title' ':' 'section content'
+# Each debate is a checkpointed graph thread; its id lives in the URL so it can be resumed after a reconnect or restart
+debate_id = st.query_params.get("debate")
+# Debates run in the background job manager, so a rerun or a dropped connection only stops the drawing, not the debate
+jobs = get_job_manager()
+job = jobs.get(debate_id) if debate_id else None
 
 
+def request_resume():
+    st.session_state.resume_requested = True
 
-Make your response exciting and use emojis as shown above to enhance readability and engagement.
 
-Debate:\n{history}"""
+start_debate = st.button("Start Debate")
+if debate_id and not start_debate and (job is None or job.error):
+    st.button(
+        "Resume Last Debate", on_click=request_resume, help="Continue from the last finished turn without re-running it"
+    )
+resume_debate = bool(debate_id) and st.session_state.pop("resume_requested", False)
+
+if start_debate or resume_debate:
+    from langchain_core.runnables import RunnableConfig
+
+    from debate_engine.checkpoints import open_checkpointer
+    from debate_engine.graph import load_debate
+
+    if start_debate:
+        debate_id = str(uuid.uuid4())
+        st.query_params["debate"] = debate_id
+
+    # JURY_PANEL (model:temperature[:weight],...) replaces the single streaming judge with a voting panel
+    jury_panel = make_jury_panel(os.environ.get("JURY_PANEL", ""), st.session_state.openai_api_key)
+    config = RunnableConfig(
+        configurable={
+            # Pooled per API key and process, so reruns and repeat debates reuse the client and its connections
+            "llm": get_chat_model(st.session_state.openai_api_key),
+            "thread_id": debate_id,
+            "jury_panel": jury_panel,
+            "parallel_openings": parallel_openings,
+            "adaptive_length": adaptive_length,
+            "memory_profile": memory_profile,
+            "metrics": DebateMetrics(debate_id),
+            # "__" keys are never copied into checkpoint metadata, so the credentials are not saved
+            "__google_api_key": get_secret("GOOGLE_API_KEY"),
+            "__google_cse_id": get_secret("GOOGLE_CSE_ID"),
+        }
+    )
 
-# Add a radio button for users to choose between predefined topics or custom topic
-topic_choice = st.sidebar.radio("Choose your topic:", ["Select from examples", "Enter custom topic"])
+    async def load_saved_debate():
+        async with open_checkpointer() as checkpointer:
+            return await load_debate(config, checkpointer)
 
-if topic_choice == "Select from examples":
-    debate_topic = st.selectbox("Choose a topic to explore:", DEBATE_TOPICS)
-else:
-    debate_topic = st.text_input("Enter your topic:")
+    saved_state = jobs.run(load_saved_debate()) if resume_debate else {}
+    if saved_state:
+        debate_topic = saved_state["topic"]
+    job = jobs.submit(debate_id, debate_topic, config)
 
+if job:
+    debate_topic = job.topic
 
-if st.button("Start Debate"):
     st.markdown(
         """
     <div style="
@@ -446,99 +364,27 @@ if st.button("Start Debate"):
     # Add a separator
     st.subheader("", divider="blue")
 
-    config = RunnableConfig()
-
-    workflow = StateGraph(GraphState)
-
-    workflow.add_node("Champion", champion_node)
-    workflow.add_node("Challenger", challenger_node)
-    workflow.add_node("Jury", lambda s: jury_node(s, jury_prompt, "Jury", config))
-
-    def route_step(state):
-        if state["turn_count"] >= 8:
-            return "Jury"
-        return state["current_speaker"]
-
-    workflow.add_conditional_edges(
-        "Champion", route_step, {"Champion": "Challenger", "Challenger": "Challenger", "Jury": "Jury"}
-    )
-    workflow.add_conditional_edges(
-        "Challenger", route_step, {"Champion": "Champion", "Challenger": "Champion", "Jury": "Jury"}
-    )
-
-    workflow.set_entry_point("Champion")
-    workflow.add_edge("Jury", END)
-
-    app = workflow.compile()
-
-    debate_placeholder = st.empty()
-
-    @traceable
-    async def stream_debate():
-        initial_state = {
-            "history": f"The debate topic is: {debate_topic}",
-            "current_speaker": "Champion",
-            "turn_count": 0,
-            "result": None,
-        }
-        debate_placeholder = st.empty()
-
-        try:
-            state = initial_state
-            while state["turn_count"] < 6 and not state.get("result"):
-                logging.info(f"Turn {state['turn_count']}: {state['current_speaker']}")
-                if state["current_speaker"] == "Champion":
-                    response = await champion_node(state, config)
-                elif state["current_speaker"] == "Challenger":
-                    response = await challenger_node(state, config)
-                state["history"] += f"\n\n{response}"
-                state["current_speaker"] = "Challenger" if state["current_speaker"] == "Champion" else "Champion"
-                state["turn_count"] += 1
-
-                await asyncio.sleep(0.1)
-
-                logging.info(f"Updated state after {state['current_speaker']}'s turn:")
-                logging.info(f"History: {state['history']}")
-                logging.info(f"Turn count: {state['turn_count']}")
-
-            # Handle Jury deliberation
-
-            jury_state = jury_node(state, jury_prompt, "Jury", config)
-
-            # Return only the formatted result
-            return jury_state["result"]
-        except Exception as e:
-            logging.error(f"An error occurred: {str(e)}")
-            logging.error(traceback.format_exc())
-            return None
-
-    # After the stream_debate function
+    # Draws the debate as it streams; after a rerun or reconnect this catches up from the job's log first
     with st.spinner("Debate in progress..."):
-        final_decision = asyncio.run(stream_debate())
+        follow(job, StreamlitDebateView())
+    final_decision = job.result
 
-    st.success("Debate finished!")
-    st.markdown("<hr style='border: 2px solid #e0e0e0; margin: 30px 0;'>", unsafe_allow_html=True)
-
-    # Display the final decision
+    # The jury's decision has already been rendered section by section while it streamed
     if final_decision:
-        st.markdown("<h2 style='text-align: center;'>Jury's Decision</h2>", unsafe_allow_html=True)
-
-        for section in final_decision:
-            if "🏆" in section["title"]:
-                color = "#FFD700"  # Gold
-            elif "🎭" in section["title"]:
-                color = "#4CAF50"  # Green
-            elif "🌟" in section["title"]:
-                color = "#F44336"  # Red
-            elif "💡" in section["title"]:
-                color = "#9C27B0"  # Purple
-            else:
-                color = "#607D8B"  # Blue Grey
-
-            formatted_html = format_jury_section(section["title"], section["content"], color)
-            st.markdown(formatted_html, unsafe_allow_html=True)
+        st.success("Debate finished!")
+        st.markdown("<hr style='border: 2px solid #e0e0e0; margin: 30px 0;'>", unsafe_allow_html=True)
     else:
         st.error("An error occurred during the debate. No final decision was reached.")
+        st.button(
+            "Resume Last Debate",
+            key="resume_after_error",
+            on_click=request_resume,
+            help="Continue from the last finished turn without re-running it",
+        )
+
+    if job.metrics and job.metrics.spans:
+        with st.expander("⏱️ Timing waterfall"):
+            render_waterfall(job.metrics)
 
     # Footer
     st.markdown("---")
@@ -0,0 +1,30 @@
+from langgraph.checkpoint.base import empty_checkpoint
+
+from debate_engine.checkpoints import BoundedMemorySaver
+
+
+def config(thread_id):
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def save(saver, thread_id):
+    saver.put(config(thread_id), empty_checkpoint(), {}, {})
+
+
+def test_least_recently_used_debate_is_dropped():
+    saver = BoundedMemorySaver(max_threads=2)
+    save(saver, "a")
+    save(saver, "b")
+    assert saver.get_tuple(config("a")) is not None
+    save(saver, "c")
+
+    assert set(saver.storage) == {"a", "c"}
+    assert saver.get_tuple(config("b")) is None
+
+
+def test_reading_an_unknown_debate_does_not_grow_the_saver():
+    saver = BoundedMemorySaver(max_threads=1)
+    save(saver, "a")
+    for thread_id in ("x", "y", "z"):
+        saver.get_tuple(config(thread_id))
+    assert len(saver.storage) <= 1
@@ -0,0 +1,80 @@
+import pytest
+
+from debate_engine.convergence import CONCESSION, ConvergenceScorer, novelty
+from debate_engine.transcript import Turn
+
+
+def turns(*novelties, texts=None):
+    texts = texts or ["An argument."] * len(novelties)
+    return [
+        Turn(role="Champion" if i % 2 == 0 else "Challenger", round=i // 2 + 1, text=text, novelty=score)
+        for i, (score, text) in enumerate(zip(novelties, texts))
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I concede the debate.",
+        "After hearing that, we must concede this debate to the Champion.",
+        "My opponent has won.",
+        "Frankly, my opponent wins this debate.",
+    ],
+)
+def test_concession_matches_conceding_the_whole_debate(text):
+    assert CONCESSION.search(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "While I agree with the Champion that notebooks help beginners, they hide state.",
+        "My opponent is right that Python has great libraries, but speed still matters.",
+        "I concede that remote work saves commuting time, but collaboration suffers.",
+        "I fully agree with my opponent on costs; the question is quality.",
+        "My opponent has won this point, not the argument.",
+        "My opponent wins on cost and loses on everything else.",
+    ],
+)
+def test_concession_ignores_partial_agreement(text):
+    assert not CONCESSION.search(text)
+
+
+def test_partial_agreement_does_not_end_the_debate():
+    scorer = ConvergenceScorer()
+    transcript = turns(1.0, 0.9, texts=[
+        "While I agree with the Champion that notebooks help beginners, they hide state.",
+        "My opponent is right that Python has great libraries, but speed still matters.",
+    ])
+    assert scorer.stop_reason(transcript) is None
+
+
+def test_concession_ends_the_debate_after_a_full_round():
+    scorer = ConvergenceScorer()
+    transcript = turns(1.0, 0.9, texts=["Opening argument.", "I concede the debate."])
+    assert scorer.stop_reason(transcript) == "concession"
+    assert scorer.stop_reason(transcript[:1]) is None
+
+
+def test_converged_when_recent_turns_repeat():
+    scorer = ConvergenceScorer(threshold=0.3, patience=2, min_turns=2)
+    assert scorer.stop_reason(turns(1.0, 0.8, 0.2, 0.1)) == "converged"
+    assert scorer.stop_reason(turns(1.0, 0.8, 0.2, 0.5)) is None
+
+
+def test_waits_for_min_turns_and_full_rounds():
+    scorer = ConvergenceScorer(threshold=0.3, patience=2, min_turns=4)
+    assert scorer.stop_reason(turns(0.1, 0.1)) is None
+    assert scorer.stop_reason(turns(1.0, 0.1, 0.1)) is None
+    assert scorer.stop_reason(turns(1.0, 0.5, 0.1, 0.1)) == "converged"
+
+
+def test_unscored_turns_never_converge():
+    scorer = ConvergenceScorer()
+    assert scorer.stop_reason(turns(None, None)) is None
+
+
+def test_novelty_is_share_of_unseen_content_words():
+    assert novelty("remote work saves commuting time", []) == 1.0
+    assert novelty("remote work saves commuting time", ["remote work saves commuting time"]) == 0.0
+    assert 0.0 < novelty("remote work hurts mentoring", ["remote work saves commuting time"]) < 1.0
@@ -0,0 +1,42 @@
+from debate_engine.evidence import EvidenceStore
+
+
+def result(n, words):
+    return {"title": words, "snippet": f"{words} snippet", "link": f"https://example.com/{n}"}
+
+
+def test_retrieve_answers_covered_queries():
+    store = EvidenceStore(min_coverage=0.75)
+    store.add([result(1, "remote work productivity study")], "remote work productivity")
+    assert store.retrieve("remote work productivity", 1)[0]["link"] == "https://example.com/1"
+    assert store.retrieve("office rent prices", 1) is None
+
+
+def test_oldest_documents_are_evicted_at_max_docs():
+    store = EvidenceStore(max_docs=2)
+    store.add([result(1, "remote work productivity")], "remote work")
+    store.add([result(2, "office collaboration benefits")], "office")
+    assert store.add([result(3, "hybrid schedules retention")], "hybrid") == 1
+
+    stats = store.stats()
+    assert (stats["docs"], stats["evictions"]) == (2, 1)
+    assert store.search("remote productivity") == []
+    assert store.retrieve("hybrid schedules retention", 1)[0]["link"] == "https://example.com/3"
+    # The evicted link can be stored again
+    assert store.add([result(1, "remote work productivity")], "remote work") == 1
+
+
+def test_duplicate_links_are_not_stored_twice():
+    store = EvidenceStore()
+    assert store.add([result(1, "remote work"), result(1, "remote work")], "remote work") == 1
+
+
+def test_reload_keeps_newest_documents(tmp_path):
+    path = str(tmp_path / "evidence.db")
+    store = EvidenceStore(db_path=path)
+    for n, words in enumerate(["remote work", "office space", "hybrid teams"]):
+        store.add([result(n, words)], words)
+    reloaded = EvidenceStore(db_path=path, max_docs=2)
+    assert reloaded.stats()["docs"] == 2
+    assert reloaded.search("remote work") == []
+    assert reloaded.search("hybrid teams")[0][1]["link"] == "https://example.com/2"
@@ -0,0 +1,29 @@
+import asyncio
+from unittest import mock
+
+import langsmith
+from langsmith.run_helpers import tracing_context
+
+from debate_engine.graph import prefetch_budget, traced
+
+
+def test_traces_never_record_the_run_config():
+    @traced
+    async def node(state, name, config):
+        return {"turn_count": state["turn_count"] + 1}
+
+    client = mock.MagicMock(spec=langsmith.Client)
+    config = {"configurable": {"__google_api_key": "secret-key", "__google_cse_id": "secret-cse"}}
+    with tracing_context(enabled=True, client=client, project_name="tests"):
+        assert asyncio.run(node({"turn_count": 0}, "Champion", config)) == {"turn_count": 1}
+
+    recorded = repr(client.mock_calls)
+    assert "create_run" in recorded and "Champion" in recorded
+    assert "secret-key" not in recorded and "secret-cse" not in recorded
+
+
+def test_prefetching_is_opt_in(monkeypatch):
+    monkeypatch.delenv("EVIDENCE_PREFETCH", raising=False)
+    assert prefetch_budget() == 0
+    monkeypatch.setenv("EVIDENCE_PREFETCH", "3")
+    assert prefetch_budget() == 3
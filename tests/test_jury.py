@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+
+from debate_engine.jury import Judge, VerdictParser, find_winner, panel_sections, parse_panel_spec, run_jury_panel
+
+
+def verdict(winner):
+    return f"🏆 Winner: {winner}\n\nReasoning: {winner} argued better."
+
+
+class FakeJudgeModel:
+    def __init__(self, content, delay=0.0, error=None):
+        self.content = content
+        self.delay = delay
+        self.error = error
+
+    async def ainvoke(self, prompt, config=None):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(content=self.content)
+
+
+def test_verdict_parser_emits_sections_as_blank_lines_arrive():
+    parser = VerdictParser()
+    assert parser.feed("🏆 Winner: Cham") == []
+    assert parser.feed("pion\n") == []
+    assert parser.feed("\nKey Arguments: solid ") == [{"title": "🏆 Winner", "content": "Champion"}]
+    assert parser.feed("evidence\n\nno colon here\n\n") == [{"title": "Key Arguments", "content": "solid evidence"}]
+    assert parser.close() == []
+    assert len(parser.sections) == 2
+
+
+def test_verdict_parser_close_returns_the_last_section():
+    parser = VerdictParser()
+    parser.feed("Winner: Challenger\n\nScore: 8: 7")
+    assert parser.close() == [{"title": "Score", "content": "8: 7"}]
+    assert [s["title"] for s in parser.sections] == ["Winner", "Score"]
+
+
+def test_find_winner_takes_the_first_role_named():
+    assert find_winner([{"title": "🏆 Winner", "content": "The Challenger, narrowly over the Champion"}]) == "Challenger"
+    assert find_winner([{"title": "Winner", "content": "a draw"}]) is None
+    assert find_winner([{"title": "Summary", "content": "Champion"}]) is None
+
+
+def test_parse_panel_spec():
+    assert parse_panel_spec("gpt-4:0.3, gpt-4o-mini:0.5:0.5,") == [("gpt-4", 0.3, 1.0), ("gpt-4o-mini", 0.5, 0.5)]
+
+
+def test_panel_tie_goes_to_the_earliest_judge_not_the_fastest():
+    judges = [
+        Judge("slow", FakeJudgeModel(verdict("Challenger"), delay=0.1)),
+        Judge("fast", FakeJudgeModel(verdict("Champion"))),
+    ]
+    result = asyncio.run(run_jury_panel(judges, "prompt"))
+    assert result.votes == {"Challenger": 1.0, "Champion": 1.0}
+    assert result.winner == "Challenger"
+    assert result.agreement == 0.5
+
+    result = asyncio.run(run_jury_panel(list(reversed(judges)), "prompt"))
+    assert result.winner == "Champion"
+
+
+def test_panel_weights_votes_and_ignores_failed_judges():
+    judges = [
+        Judge("a", FakeJudgeModel(verdict("Champion"))),
+        Judge("b", FakeJudgeModel(verdict("Challenger")), weight=2.0),
+        Judge("c", FakeJudgeModel("", error=RuntimeError("rate limited"))),
+    ]
+    result = asyncio.run(run_jury_panel(judges, "prompt", max_concurrency=1))
+    assert result.winner == "Challenger"
+    assert result.votes == {"Champion": 1.0, "Challenger": 2.0}
+    assert result.verdicts[2].error == "rate limited"
+    assert result.agreement == 0.5
+
+    sections = panel_sections(result)
+    assert sections[0] == {"title": "🏆 Winner", "content": "Challenger"}
+    assert sections[2] == {"title": "Reasoning", "content": "Challenger argued better."}
+
+
+def test_panel_without_votes_has_no_winner():
+    judges = [Judge("a", FakeJudgeModel("", error=RuntimeError("down")))]
+    result = asyncio.run(run_jury_panel(judges, "prompt"))
+    assert (result.winner, result.votes, result.agreement) == (None, {}, 0.0)
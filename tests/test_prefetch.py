@@ -0,0 +1,21 @@
+from debate_engine.prefetch import EvidencePool, similarity
+
+
+def fake_search(query, num_results):
+    return [{"title": query, "link": "https://example.com", "snippet": ""}][:num_results]
+
+
+def test_similarity_is_relative_to_both_queries():
+    assert similarity("remote work productivity", "Remote work productivity") == 1.0
+    assert similarity("AutoML", "AutoML adoption enterprise criticism evidence") == 0.2
+    assert similarity("", "remote work") == 0.0
+
+
+def test_pool_answers_close_queries_only():
+    pool = EvidencePool(fake_search)
+    pool.prefetch("remote work productivity benefits evidence")
+    pool.prefetch("AutoML adoption enterprise criticism evidence")
+
+    assert pool.lookup("remote work productivity evidence")[0]["title"] == "remote work productivity benefits evidence"
+    assert pool.lookup("AutoML") is None
+    assert pool.stats()["hits"] == 1
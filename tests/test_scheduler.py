@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+
+from benchmarks.fake_servers import FakeChatServer
+from debate_engine import scheduler as scheduler_module
+from debate_engine.scheduler import (
+    PRIORITY_IN_PROGRESS,
+    PRIORITY_NEW,
+    LLMScheduler,
+    ScheduledChatOpenAI,
+    llm_priority,
+)
+
+
+def rate_limit_error(retry_after):
+    return SimpleNamespace(response=SimpleNamespace(headers={"retry-after": str(retry_after)}))
+
+
+def scheduler():
+    return LLMScheduler(requests_per_minute=1_000_000, tokens_per_minute=1_000_000_000)
+
+
+def test_in_progress_debates_are_admitted_before_new_ones():
+    async def run():
+        s = scheduler()
+        s.backoff(rate_limit_error(0.2), 0)  # hold everyone until all three are queued
+        admitted = []
+
+        async def call(name, priority):
+            await s.acquire(10, priority=priority)
+            admitted.append(name)
+
+        async def in_progress():
+            with llm_priority(PRIORITY_IN_PROGRESS):
+                await call("in progress", None)
+
+        await asyncio.gather(call("new 1", PRIORITY_NEW), call("new 2", PRIORITY_NEW), in_progress())
+        return admitted
+
+    assert asyncio.run(run()) == ["in progress", "new 1", "new 2"]
+
+
+def test_rate_limit_pauses_every_caller_for_retry_after():
+    async def run():
+        s = scheduler()
+        assert s.backoff(rate_limit_error(0.3), 0) == 0.3
+        waits = await asyncio.gather(s.acquire(10), s.acquire(10))
+        return s, waits
+
+    s, waits = asyncio.run(run())
+    assert all(wait >= 0.25 for wait in waits)
+    assert s.stats()["rate_limited"] == 1
+    assert s.stats()["admitted"] == 2
+
+
+def test_backoff_without_retry_after_grows_with_attempts():
+    s = scheduler()
+    error = SimpleNamespace(response=SimpleNamespace(headers={}))
+    assert 0.5 <= s.backoff(error, 0) <= 1.5
+    assert 4 <= s.backoff(error, 3) <= 12
+
+
+def test_cancelled_caller_leaves_the_queue():
+    async def run():
+        s = scheduler()
+        s.backoff(rate_limit_error(0.2), 0)
+        waiting = asyncio.create_task(s.acquire(10, priority=PRIORITY_IN_PROGRESS))
+        await asyncio.sleep(0.05)
+        assert s.stats()["queue_depth"] == 1
+        waiting.cancel()
+        try:
+            await waiting
+        except asyncio.CancelledError:
+            pass
+        depth = s.stats()["queue_depth"]
+        # The next caller must not queue behind the cancelled ticket
+        await asyncio.wait_for(s.acquire(10, priority=PRIORITY_NEW), timeout=2)
+        return s, depth
+
+    s, depth = asyncio.run(run())
+    assert depth == 0
+    assert s.stats()["admitted"] == 1
+
+
+def test_token_budget_delays_calls_that_do_not_fit():
+    async def run():
+        s = LLMScheduler(requests_per_minute=1_000_000, tokens_per_minute=600)
+        await s.acquire(600)
+        return await s.acquire(5)
+
+    # 600 tokens a minute refill at 10 a second, so 5 more take about half a second
+    assert 0.3 <= asyncio.run(run()) <= 1.0
+
+
+def flaky_model(chat, s):
+    return ScheduledChatOpenAI(base_url=chat.url, api_key="fake", model="fake-gpt-4", scheduler=s, streaming=False)
+
+
+def test_server_errors_are_retried_without_pausing_everyone(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "_jittered", lambda attempt: 0.01)
+    s = scheduler()
+    with FakeChatServer(first_token_latency=0, tokens_per_second=10_000, server_errors=1) as chat:
+        reply = asyncio.run(flaky_model(chat, s).ainvoke("Hello"))
+    assert reply.content == chat.reply
+    stats = s.stats()
+    assert (stats["retried"], stats["rate_limited"], stats["admitted"]) == (1, 0, 2)
+
+
+def test_sync_calls_are_scheduled_and_retried(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "_jittered", lambda attempt: 0.01)
+    s = scheduler()
+    with FakeChatServer(first_token_latency=0, tokens_per_second=10_000, server_errors=1) as chat:
+        assert flaky_model(chat, s).invoke("Hello").content == chat.reply
+        streamed = "".join(chunk.content for chunk in flaky_model(chat, s).stream("Hello"))
+    assert streamed.strip() == chat.reply
+    assert (s.stats()["retried"], s.stats()["admitted"]) == (1, 3)
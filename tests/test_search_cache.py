@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+from debate_engine import search_cache
+from debate_engine.search_cache import SearchCache, normalize_query
+
+RESULTS = [{"title": "Remote work", "link": "https://example.com", "snippet": "..."}]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(search_cache, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def test_normalize_query_collapses_case_and_whitespace():
+    assert normalize_query("  Remote   WORK\tproductivity ") == "remote work productivity"
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = SearchCache(ttl_seconds=60)
+    cache.set("remote work", 3, RESULTS)
+    clock.value += 59
+    assert cache.get("Remote  work", 3) == RESULTS
+    clock.value += 2
+    assert cache.get("remote work", 3) is None
+    assert cache.stats()["entries"] == 0
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchCache(max_entries=2)
+    cache.set("a", 3, RESULTS)
+    cache.set("b", 3, RESULTS)
+    cache.get("a", 3)
+    cache.set("c", 3, RESULTS)
+    assert cache.get("b", 3) is None
+    assert cache.get("a", 3) == RESULTS
+    assert cache.get("c", 3) == RESULTS
+
+
+def test_result_count_is_part_of_the_key():
+    cache = SearchCache()
+    cache.set("remote work", 3, RESULTS)
+    assert cache.get("remote work", 5) is None
+
+
+def test_sqlite_entries_survive_a_restart_until_they_expire(tmp_path, clock):
+    path = str(tmp_path / "search.db")
+    SearchCache(ttl_seconds=60, db_path=path).set("remote work", 3, RESULTS)
+
+    assert SearchCache(ttl_seconds=60, db_path=path).get("remote work", 3) == RESULTS
+    clock.value += 61
+    assert SearchCache(ttl_seconds=60, db_path=path).get("remote work", 3) is None
+
+
+def test_purge_expired_drops_old_rows(tmp_path, clock):
+    cache = SearchCache(ttl_seconds=60, db_path=str(tmp_path / "search.db"))
+    cache.set("old", 3, RESULTS)
+    clock.value += 61
+    cache.set("new", 3, RESULTS)
+    assert cache.purge_expired() == 1
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fake_servers import FakeSearchServer
+from debate_engine import search_client
+from debate_engine.search_client import GoogleSearchBackend, close_search_backends, get_search_backend
+
+
+@pytest.fixture
+def search_server(monkeypatch):
+    with FakeSearchServer(latency=0) as server:
+        monkeypatch.setenv("SEARCH_API_ENDPOINT", server.url)
+        yield server
+    close_search_backends()
+
+
+def test_close_releases_sync_and_async_connections(search_server):
+    backend = GoogleSearchBackend("key", "cse", api_endpoint=search_server.url)
+
+    async def search():
+        return await backend.asearch("remote work", 1)
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(search())[0]["title"] == "remote work (1)"
+        assert backend.search("remote work", 1)[0]["title"] == "remote work (1)"
+        assert backend._transport.loops() == 1
+
+        backend.close()
+        assert backend._transport.loops() == 0 and backend._https == []
+        # A closed backend reconnects if it is used again
+        assert backend.search("remote work", 1)
+    finally:
+        loop.close()
+        backend.close()
+
+
+def test_least_recently_used_backend_is_closed(search_server, monkeypatch):
+    monkeypatch.setenv("SEARCH_BACKEND_POOL_SIZE", "2")
+    closed = []
+    monkeypatch.setattr(GoogleSearchBackend, "close", lambda self: closed.append(self.api_key))
+
+    first = get_search_backend("a", "cse")
+    get_search_backend("b", "cse")
+    assert get_search_backend("a", "cse") is first
+    get_search_backend("c", "cse")
+    assert closed == ["b"]
+
+    close_search_backends()
+    assert sorted(closed) == ["a", "b", "c"]
+    assert not search_client._backends
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from debate_engine import tools
+from debate_engine.search_cache import SearchCache
+from debate_engine.search_client import SearchBackend, set_search_backend
+
+CONFIG = {"configurable": {"__google_api_key": "key", "__google_cse_id": "cse"}}
+
+
+class CountingBackend(SearchBackend):
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, search_term, num_results):
+        self.calls += 1
+        return [{"title": search_term, "link": f"https://example.com/{self.calls}", "snippet": ""}][:num_results]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    cache = SearchCache(max_entries=16, ttl_seconds=60)
+    monkeypatch.setattr(tools, "get_search_cache", lambda: cache)
+    monkeypatch.setattr(tools, "get_evidence_store", lambda: None)
+    backend = CountingBackend()
+    set_search_backend(backend)
+    yield backend
+    set_search_backend(None)
+
+
+def test_live_search_counts_one_miss(backend):
+    tools.search_google("remote work productivity", 1, config=CONFIG)
+    tools.search_google("remote work productivity", 1, config=CONFIG)
+    stats = tools.get_search_cache().stats()
+    assert backend.calls == 1
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_async_live_search_counts_one_miss(backend):
+    async def search_twice():
+        await tools.asearch_google("remote work productivity", 1, config=CONFIG)
+        await tools.asearch_google("Remote work  productivity", 1, config=CONFIG)
+
+    asyncio.run(search_twice())
+    stats = tools.get_search_cache().stats()
+    assert backend.calls == 1
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_missing_credentials_are_rejected(backend):
+    with pytest.raises(ValueError):
+        tools.search_google("remote work", 1, config={"configurable": {}})
+
+
+def test_prefetch_searches_leave_the_hit_rate_alone(backend):
+    tools.prefetch_search("key", "cse", "remote work productivity", 1)
+    tools.prefetch_search("key", "cse", "remote work productivity", 1)
+    tools.search_google("remote work productivity", 1, config=CONFIG)
+    stats = tools.get_search_cache().stats()
+    assert backend.calls == 1
+    assert (stats["hits"], stats["misses"]) == (1, 0)
@@ -0,0 +1,67 @@
+from debate_engine.transcript import ContextBuilder, Turn, count_tokens, format_turn, make_turn
+
+
+def debate(rounds, words=40):
+    return [
+        Turn(role=role, round=r, text=" ".join(f"{role.lower()}{r}word{i}" for i in range(words)))
+        for r in range(1, rounds + 1)
+        for role in ("Champion", "Challenger")
+    ]
+
+
+def summarize(turn):
+    return f"summary of {turn.role} {turn.round}"
+
+
+def test_empty_debate():
+    assert ContextBuilder(budget_tokens=100).build([]) == ("No arguments have been made yet.", 0)
+
+
+def test_short_debate_goes_in_verbatim():
+    turns = debate(1)
+    context, used = ContextBuilder(budget_tokens=10_000, summarize=summarize).build(turns)
+    assert "Earlier arguments" not in context
+    assert all(format_turn(turn) in context for turn in turns)
+    assert used == sum(count_tokens(format_turn(turn)) for turn in turns)
+
+
+def test_long_debate_is_packed_into_the_budget():
+    turns = debate(6)
+    budget = 3 * count_tokens(format_turn(turns[-1]))
+    context, used = ContextBuilder(budget_tokens=budget, verbatim_share=0.7, summarize=summarize).build(turns)
+
+    assert used <= budget
+    # The newest turns are verbatim, the ones before them summarized, oldest first
+    assert format_turn(turns[-1]) in context
+    assert format_turn(turns[0]) not in context
+    summaries = context.split("Most recent arguments:")[0]
+    assert "summary of Challenger 5" in summaries
+    assert summaries.index("summary of Champion 5") < summaries.index("summary of Challenger 5")
+
+
+def test_prompt_size_stays_flat_as_rounds_are_added():
+    builder = ContextBuilder(budget_tokens=200, summarize=summarize)
+    sizes = [builder.build(debate(rounds))[1] for rounds in (4, 8, 16)]
+    assert max(sizes) <= 200
+    assert sizes[0] > 0
+
+
+def test_summaries_are_computed_once_per_turn():
+    calls = []
+
+    def counting_summarize(turn):
+        calls.append((turn.role, turn.round))
+        return "short"
+
+    turns = debate(4)
+    builder = ContextBuilder(budget_tokens=150, summarize=counting_summarize)
+    builder.build(turns)
+    first = len(calls)
+    builder.build(turns)
+    assert first > 0 and len(calls) == first
+
+
+def test_make_turn_collects_unique_citations():
+    turn = make_turn("Champion", 1, " See https://a.example/x. And https://a.example/x, https://b.example ")
+    assert turn.citations == ["https://a.example/x", "https://b.example"]
+    assert turn.text.startswith("See")